@@ -15,6 +15,37 @@ from contextlib import contextmanager
 from models import Exercise, ExerciseLog, Task, CalendarEvent
 from utils import DATABASE_NAME
 
+# Queries shared by the single-purpose getters and fetch_day_bundle
+_TASKS_BY_DATE_SQL = """
+    SELECT id, title, is_completed, date, due_date, priority, category
+    FROM tasks
+    WHERE date = ?
+    ORDER BY priority DESC, created_at ASC
+"""
+
+_ALL_EXERCISES_SQL = """
+    SELECT id, name, category, color, target_value, unit
+    FROM exercises
+    ORDER BY created_at ASC
+"""
+
+_LOGS_BY_DATE_SQL = """
+    SELECT 
+        el.id,
+        el.exercise_id,
+        el.date,
+        el.completed,
+        el.actual_value,
+        el.notes,
+        e.target_value,
+        e.unit,
+        e.category
+    FROM exercise_logs el
+    JOIN exercises e ON el.exercise_id = e.id
+    WHERE el.date = ?
+    ORDER BY e.created_at ASC
+"""
+
 
 class DatabaseManager:
     """
@@ -56,9 +87,12 @@ class DatabaseManager:
             sqlite3.Error: If database initialization fails
         """
         try:
+            # The UI re-runs a small set of fixed queries on every date or
+            # month change; a larger statement cache keeps them compiled
             self._connection = sqlite3.connect(
                 self._db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=256
             )
             self._connection.row_factory = sqlite3.Row
             
@@ -151,6 +185,92 @@ class DatabaseManager:
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Fetch one failed: {e}") from e
     
+    def execute_returning(self, query: str, params: tuple = ()) -> Optional[tuple]:
+        """
+        Execute a write query with a RETURNING clause and fetch its row.
+        
+        The statement runs inside a transaction so the write is committed
+        and the returned values are read in the same round trip.
+        
+        Args:
+            query: SQL query string ending in a RETURNING clause
+            params: Query parameters tuple
+            
+        Returns:
+            First returned row or None
+            
+        Raises:
+            sqlite3.Error: If execution fails
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(query, params)
+                # Drain the statement before commit; SQLite refuses to
+                # commit while a RETURNING statement is still stepping
+                rows = cursor.fetchall()
+            return rows[0] if rows else None
+        except sqlite3.Error as e:
+            raise sqlite3.Error(f"Query execution failed: {e}") from e
+    
+    # ==================== Row Mapping ====================
+    
+    @staticmethod
+    def _validate_iso_date(date: str) -> None:
+        """
+        Check that a date string is in ISO format.
+        
+        Args:
+            date: Date string to check
+            
+        Raises:
+            ValueError: If date format is invalid
+        """
+        from datetime import datetime
+        try:
+            datetime.fromisoformat(date)
+        except ValueError as e:
+            raise ValueError(f"Invalid date format '{date}': Expected YYYY-MM-DD") from e
+    
+    @staticmethod
+    def _task_from_row(row: sqlite3.Row) -> Task:
+        """Build a Task from a tasks row."""
+        return Task(
+            id=row['id'],
+            title=row['title'],
+            is_completed=bool(row['is_completed']),
+            date=row['date'],
+            due_date=row['due_date'],
+            priority=row['priority'],
+            category=row['category']
+        )
+    
+    @staticmethod
+    def _exercise_from_row(row: sqlite3.Row) -> Exercise:
+        """Build an Exercise from an exercises row."""
+        return Exercise(
+            id=row['id'],
+            name=row['name'],
+            category=row['category'],
+            color=row['color'],
+            target_value=row['target_value'],
+            unit=row['unit']
+        )
+    
+    @staticmethod
+    def _exercise_log_from_row(row: sqlite3.Row) -> ExerciseLog:
+        """Build an ExerciseLog from an exercise_logs row joined with its exercise."""
+        return ExerciseLog(
+            id=row['id'],
+            exercise_id=row['exercise_id'],
+            date=row['date'],
+            completed=bool(row['completed']),
+            actual_value=row['actual_value'],
+            target_value=row['target_value'],
+            unit=row['unit'],
+            category=row['category'],
+            notes=row['notes'] or ""
+        )
+    
     # ==================== Exercise Operations ====================
     
     def create_exercise(self, exercise: Exercise) -> int:
@@ -199,26 +319,10 @@ class DatabaseManager:
         """
         try:
             cursor = self._connection.cursor()
-            cursor.execute(
-                """
-                SELECT id, name, category, color, target_value, unit
-                FROM exercises
-                ORDER BY created_at ASC
-                """
-            )
+            cursor.execute(_ALL_EXERCISES_SQL)
             
             rows = cursor.fetchall()
-            return [
-                Exercise(
-                    id=row['id'],
-                    name=row['name'],
-                    category=row['category'],
-                    color=row['color'],
-                    target_value=row['target_value'],
-                    unit=row['unit']
-                )
-                for row in rows
-            ]
+            return [self._exercise_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to retrieve exercises: {e}") from e
     
@@ -250,14 +354,7 @@ class DatabaseManager:
             if row is None:
                 return None
             
-            return Exercise(
-                id=row['id'],
-                name=row['name'],
-                category=row['category'],
-                color=row['color'],
-                target_value=row['target_value'],
-                unit=row['unit']
-            )
+            return self._exercise_from_row(row)
         except sqlite3.Error as e:
             raise sqlite3.Error(
                 f"Failed to retrieve exercise {exercise_id}: {e}"
@@ -384,41 +481,10 @@ class DatabaseManager:
         """
         try:
             cursor = self._connection.cursor()
-            cursor.execute(
-                """
-                SELECT 
-                    el.id,
-                    el.exercise_id,
-                    el.date,
-                    el.completed,
-                    el.actual_value,
-                    el.notes,
-                    e.target_value,
-                    e.unit,
-                    e.category
-                FROM exercise_logs el
-                JOIN exercises e ON el.exercise_id = e.id
-                WHERE el.date = ?
-                ORDER BY e.created_at ASC
-                """,
-                (date,)
-            )
+            cursor.execute(_LOGS_BY_DATE_SQL, (date,))
             
             rows = cursor.fetchall()
-            return [
-                ExerciseLog(
-                    id=row['id'],
-                    exercise_id=row['exercise_id'],
-                    date=row['date'],
-                    completed=bool(row['completed']),
-                    actual_value=row['actual_value'],
-                    target_value=row['target_value'],
-                    unit=row['unit'],
-                    category=row['category'],
-                    notes=row['notes'] or ""
-                )
-                for row in rows
-            ]
+            return [self._exercise_log_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to retrieve logs for {date}: {e}") from e
     
@@ -463,20 +529,7 @@ class DatabaseManager:
             )
             
             rows = cursor.fetchall()
-            return [
-                ExerciseLog(
-                    id=row['id'],
-                    exercise_id=row['exercise_id'],
-                    date=row['date'],
-                    completed=bool(row['completed']),
-                    actual_value=row['actual_value'],
-                    target_value=row['target_value'],
-                    unit=row['unit'],
-                    category=row['category'],
-                    notes=row['notes'] or ""
-                )
-                for row in rows
-            ]
+            return [self._exercise_log_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(
                 f"Failed to retrieve logs for range {start_date}-{end_date}: {e}"
@@ -546,18 +599,7 @@ class DatabaseManager:
             )
             
             rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row['id'],
-                    title=row['title'],
-                    is_completed=bool(row['is_completed']),
-                    date=row['date'],
-                    due_date=row['due_date'],
-                    priority=row['priority'],
-                    category=row['category']
-                )
-                for row in rows
-            ]
+            return [self._task_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to retrieve tasks: {e}") from e
     
@@ -587,18 +629,7 @@ class DatabaseManager:
             )
             
             rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row['id'],
-                    title=row['title'],
-                    is_completed=bool(row['is_completed']),
-                    date=row['date'],
-                    due_date=row['due_date'],
-                    priority=row['priority'],
-                    category=row['category']
-                )
-                for row in rows
-            ]
+            return [self._task_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(
                 f"Failed to retrieve tasks for category '{category}': {e}"
@@ -619,37 +650,13 @@ class DatabaseManager:
             ValueError: If date format is invalid
         """
         try:
-            # Validate date format
-            from datetime import datetime
-            try:
-                datetime.fromisoformat(date)
-            except ValueError as e:
-                raise ValueError(f"Invalid date format '{date}': Expected YYYY-MM-DD") from e
+            self._validate_iso_date(date)
             
             cursor = self._connection.cursor()
-            cursor.execute(
-                """
-                SELECT id, title, is_completed, date, due_date, priority, category
-                FROM tasks
-                WHERE date = ?
-                ORDER BY priority DESC, created_at ASC
-                """,
-                (date,)
-            )
+            cursor.execute(_TASKS_BY_DATE_SQL, (date,))
             
             rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row['id'],
-                    title=row['title'],
-                    is_completed=bool(row['is_completed']),
-                    date=row['date'],
-                    due_date=row['due_date'],
-                    priority=row['priority'],
-                    category=row['category']
-                )
-                for row in rows
-            ]
+            return [self._task_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(
                 f"Failed to retrieve tasks for date '{date}': {e}"
@@ -693,18 +700,57 @@ class DatabaseManager:
             )
             
             rows = cursor.fetchall()
-            return [
-                Task(
-                    id=row['id'],
-                    title=row['title'],
-                    is_completed=bool(row['is_completed']),
-                    date=row['date'],
-                    due_date=row['due_date'],
-                    priority=row['priority'],
-                    category=row['category']
-                )
-                for row in rows
-            ]
+            return [self._task_from_row(row) for row in rows]
+        except sqlite3.Error as e:
+            raise sqlite3.Error(
+                f"Failed to retrieve tasks for {year}-{month:02d}: {e}"
+            ) from e
+        except ValueError:
+            # Re-raise validation errors
+            raise
+    
+    def get_calendar_tasks_for_month(self, year: int, month: int) -> List[Task]:
+        """
+        Retrieve tasks to mark on the calendar for a month.
+        
+        Unlike get_tasks_by_month, which only matches due_date, a task is
+        included when its due_date OR its date falls in the month. Both
+        columns are indexed, so SQLite answers each side of the OR with an
+        index range scan.
+        
+        Args:
+            year: Target year (e.g., 2026)
+            month: Target month (1-12)
+            
+        Returns:
+            List of Task models ordered by priority (high to low) then creation
+            
+        Raises:
+            sqlite3.Error: If query fails
+            ValueError: If month is invalid
+        """
+        try:
+            # Validate month range
+            if not 1 <= month <= 12:
+                raise ValueError(f"Invalid month: {month}. Must be 1-12")
+            
+            first_day = f"{year:04d}-{month:02d}-01"
+            last_day = f"{year:04d}-{month:02d}-31"
+            
+            cursor = self._connection.cursor()
+            cursor.execute(
+                """
+                SELECT id, title, is_completed, date, due_date, priority, category
+                FROM tasks
+                WHERE due_date BETWEEN ? AND ?
+                   OR date BETWEEN ? AND ?
+                ORDER BY priority DESC, created_at ASC
+                """,
+                (first_day, last_day, first_day, last_day)
+            )
+            
+            rows = cursor.fetchall()
+            return [self._task_from_row(row) for row in rows]
         except sqlite3.Error as e:
             raise sqlite3.Error(
                 f"Failed to retrieve tasks for {year}-{month:02d}: {e}"
@@ -713,6 +759,41 @@ class DatabaseManager:
             # Re-raise validation errors
             raise
     
+    def get_calendar_tasks_for_date(self, date: str) -> List[Task]:
+        """
+        Retrieve tasks to list on the calendar for a specific date.
+        
+        Unlike get_tasks_by_date, which only matches date, a task is
+        included when its due_date OR its date equals the given date.
+        
+        Args:
+            date: Date in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            List of Task models ordered by priority (high to low) then title
+            
+        Raises:
+            sqlite3.Error: If query fails
+        """
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(
+                """
+                SELECT id, title, is_completed, date, due_date, priority, category
+                FROM tasks
+                WHERE due_date = ? OR date = ?
+                ORDER BY priority DESC, title ASC
+                """,
+                (date, date)
+            )
+            
+            rows = cursor.fetchall()
+            return [self._task_from_row(row) for row in rows]
+        except sqlite3.Error as e:
+            raise sqlite3.Error(
+                f"Failed to retrieve tasks for date '{date}': {e}"
+            ) from e
+    
     def update_task(self, task: Task) -> bool:
         """
         Update existing task.
@@ -934,6 +1015,61 @@ class DatabaseManager:
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to delete event: {e}") from e
     
+    # ==================== Daily Bundle Operations ====================
+    
+    def fetch_day_bundle(
+        self,
+        date: str
+    ) -> Tuple[Optional[sqlite3.Row], List[Task], List[Exercise], List[ExerciseLog]]:
+        """
+        Retrieve everything the home screen shows for a date in one batch.
+        
+        Runs the daily points, task, exercise and exercise log queries
+        inside one read transaction, so all four see the same snapshot and
+        SQLite takes its shared lock once rather than once per statement.
+        
+        Args:
+            date: Date in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            Tuple of (daily points row or None, tasks for the date,
+            all exercise definitions, exercise logs for the date)
+            
+        Raises:
+            ValueError: If date format is invalid
+            sqlite3.Error: If any query fails
+        """
+        self._validate_iso_date(date)
+        
+        try:
+            with self.transaction() as cursor:
+                # sqlite3 only opens transactions implicitly for writes
+                if not self._connection.in_transaction:
+                    cursor.execute("BEGIN")
+                
+                cursor.execute(
+                    """
+                    SELECT physical, mental, hp, updated_at
+                    FROM daily_points
+                    WHERE date = ?
+                    """,
+                    (date,)
+                )
+                points_row = cursor.fetchone()
+                
+                cursor.execute(_TASKS_BY_DATE_SQL, (date,))
+                tasks = [self._task_from_row(row) for row in cursor.fetchall()]
+                
+                cursor.execute(_ALL_EXERCISES_SQL)
+                exercises = [self._exercise_from_row(row) for row in cursor.fetchall()]
+                
+                cursor.execute(_LOGS_BY_DATE_SQL, (date,))
+                logs = [self._exercise_log_from_row(row) for row in cursor.fetchall()]
+            
+            return points_row, tasks, exercises, logs
+        except sqlite3.Error as e:
+            raise sqlite3.Error(f"Failed to retrieve day bundle for {date}: {e}") from e
+    
     # ==================== Utility Methods ====================
     
     def close(self) -> None:
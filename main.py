@@ -5,6 +5,7 @@ Initializes application paths, creates Qt application with global
 font settings, and launches the main window.
 """
 
+import logging
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
@@ -55,6 +56,20 @@ def initialize_application_directories() -> None:
     history_path.mkdir(exist_ok=True)
 
 
+def configure_logging() -> None:
+    """
+    Configure application-wide logging.
+    
+    Notes:
+        The root level stays above DEBUG so the per-item debug logging in
+        widgets short-circuits in Logger.isEnabledFor without formatting.
+    """
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
+    )
+
+
 def configure_application_paths() -> None:
     """
     Configure global application paths for cross-module access.
@@ -116,6 +131,9 @@ def main() -> int:
         RuntimeError: If critical initialization fails
     """
     try:
+        # Phase 0: Configure logging
+        configure_logging()
+        
         # Phase 1: Configure application paths
         configure_application_paths()
         
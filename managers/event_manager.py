@@ -5,13 +5,18 @@ Handles event CRUD operations and provides date-based queries
 for calendar widget integration.
 """
 
-from typing import List, Dict, Optional
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from database import DatabaseManager
 from models import CalendarEvent, EventSummary
 from utils import get_today
 
+logger = logging.getLogger(__name__)
+
 
 class EventManager(QObject):
     """
@@ -32,6 +37,34 @@ class EventManager(QObject):
         """Initialize manager with database connection."""
         super().__init__()
         self._db = DatabaseManager()
+        # (year, month) -> {date: [events]}; filled lazily per month and
+        # dropped on every write so reads never see stale rows
+        self._month_index: Dict[Tuple[int, int], Dict[str, List[CalendarEvent]]] = {}
+    
+    def _invalidate_index(self) -> None:
+        """Drop cached month indexes after any event write."""
+        self._month_index.clear()
+    
+    def _index_month(self, year: int, month: int) -> Dict[str, List[CalendarEvent]]:
+        """
+        Return the date -> events index for a month, loading it on first use.
+        
+        Args:
+            year: Year (e.g., 2026)
+            month: Month (1-12)
+            
+        Returns:
+            Mapping of ISO date to events on that date
+        """
+        key = (year, month)
+        by_date = self._month_index.get(key)
+        if by_date is None:
+            by_date = defaultdict(list)
+            for event in self._db.get_events_by_month(year, month):
+                by_date[event.event_date].append(event)
+            by_date = dict(by_date)
+            self._month_index[key] = by_date
+        return by_date
     
     # ==================== Event CRUD Operations ====================
     
@@ -60,6 +93,7 @@ class EventManager(QObject):
             )
             
             event_id = self._db.create_event(event)
+            self._invalidate_index()
             
             self.data_changed.emit()
             self.event_created.emit(event_date)
@@ -78,12 +112,19 @@ class EventManager(QObject):
             date: Date in ISO format
             
         Returns:
-            List of CalendarEvent models for the date
+            List of CalendarEvent models for the date, empty if the
+            date is not a valid YYYY-MM-DD string
         """
         try:
-            return self._db.get_events_by_date(date)
-        except Exception as e:
-            print(f"Error retrieving events for {date}: {e}")
+            day = datetime.strptime(date, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            logger.warning("Invalid event date %r: expected YYYY-MM-DD", date)
+            return []
+        
+        try:
+            return list(self._index_month(day.year, day.month).get(day.isoformat(), ()))
+        except Exception:
+            logger.exception("Error retrieving events for %s", date)
             return []
     
     def get_events_for_month(self, year: int, month: int) -> List[CalendarEvent]:
@@ -98,7 +139,8 @@ class EventManager(QObject):
             List of CalendarEvent models in the month
         """
         try:
-            return self._db.get_events_by_month(year, month)
+            by_date = self._index_month(year, month)
+            return [event for day in sorted(by_date) for event in by_date[day]]
         except Exception as e:
             print(f"Error retrieving events for {year}-{month:02d}: {e}")
             return []
@@ -174,6 +216,7 @@ class EventManager(QObject):
             success = self._db.update_event(updated_event)
             
             if success:
+                self._invalidate_index()
                 self.data_changed.emit()
             
             return success
@@ -196,6 +239,7 @@ class EventManager(QObject):
             success = self._db.delete_event(event_id)
             
             if success:
+                self._invalidate_index()
                 self.data_changed.emit()
             
             return success
@@ -220,10 +264,7 @@ class EventManager(QObject):
             List of ISO date strings that have events
         """
         try:
-            events = self._db.get_events_by_month(year, month)
-            # Get unique dates
-            dates = list(set(event.event_date for event in events))
-            return sorted(dates)
+            return sorted(self._index_month(year, month))
         except Exception as e:
             print(f"Error getting event dates: {e}")
             return []
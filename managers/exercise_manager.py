@@ -245,34 +245,56 @@ class ExerciseManager(QObject):
             exercises = self._db.get_all_exercises()
             logs = self._db.get_logs_by_date(date)
             
-            # Create map of exercise_id -> log
-            log_map = {log.exercise_id: log for log in logs}
-            
-            # Build combined list with placeholder logs for missing entries
-            result = []
-            for exercise in exercises:
-                if exercise.id in log_map:
-                    log = log_map[exercise.id]
-                else:
-                    # Create placeholder log
-                    log = ExerciseLog(
-                        exercise_id=exercise.id,
-                        date=date,
-                        completed=False,
-                        actual_value=0,
-                        target_value=exercise.target_value,
-                        unit=exercise.unit,
-                        category=exercise.category
-                    )
-                
-                result.append((exercise, log))
-            
-            return result
+            return self.combine_logs(date, exercises, logs)
             
         except Exception as e:
             print(f"Error retrieving logs for {date}: {e}")
             return []
     
+    def combine_logs(
+        self,
+        date: str,
+        exercises: List[Exercise],
+        logs: List[ExerciseLog]
+    ) -> List[Tuple[Exercise, ExerciseLog]]:
+        """
+        Pair exercise definitions with their logs for a date.
+        
+        Creates placeholder logs for exercises without entries. Useful
+        when exercises and logs were already fetched in one batch.
+        
+        Args:
+            date: Date in ISO format
+            exercises: All exercise definitions
+            logs: Logs recorded on the date
+            
+        Returns:
+            List of (Exercise, ExerciseLog) tuples
+        """
+        # Create map of exercise_id -> log
+        log_map = {log.exercise_id: log for log in logs}
+        
+        # Build combined list with placeholder logs for missing entries
+        result = []
+        for exercise in exercises:
+            if exercise.id in log_map:
+                log = log_map[exercise.id]
+            else:
+                # Create placeholder log
+                log = ExerciseLog(
+                    exercise_id=exercise.id,
+                    date=date,
+                    completed=False,
+                    actual_value=0,
+                    target_value=exercise.target_value,
+                    unit=exercise.unit,
+                    category=exercise.category
+                )
+            
+            result.append((exercise, log))
+        
+        return result
+    
     # ==================== Statistics & Aggregations ====================
     
     def get_today_summary(self) -> ExerciseSummary:
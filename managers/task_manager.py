@@ -5,6 +5,7 @@ Handles task CRUD operations, completion tracking, and provides
 grouped task statistics for checklist widgets.
 """
 
+import logging
 from typing import List, Dict, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -12,6 +13,8 @@ from database import DatabaseManager
 from models import Task, TaskGroup
 from utils import get_today
 
+logger = logging.getLogger(__name__)
+
 
 class TaskManager(QObject):
     """
@@ -154,6 +157,43 @@ class TaskManager(QObject):
             print(f"Error retrieving tasks for {year}-{month:02d}: {e}")
             return []
     
+    def get_calendar_tasks_for_month(self, year: int, month: int) -> List[Task]:
+        """
+        Retrieve tasks whose due_date OR date falls in specified month.
+        
+        Unlike get_tasks_by_month, a task also matches by its date column.
+        
+        Args:
+            year: Target year
+            month: Target month (1-12)
+            
+        Returns:
+            List of Task models for the calendar month view
+        """
+        try:
+            return self._db.get_calendar_tasks_for_month(year, month)
+        except Exception:
+            logger.exception("Error retrieving calendar tasks for %d-%02d", year, month)
+            return []
+    
+    def get_calendar_tasks_for_date(self, date: str) -> List[Task]:
+        """
+        Retrieve tasks whose due_date OR date is the specified date.
+        
+        Unlike get_tasks_by_date, a task also matches by its due_date column.
+        
+        Args:
+            date: Date in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            List of Task models ordered by priority (high to low) then title
+        """
+        try:
+            return self._db.get_calendar_tasks_for_date(date)
+        except Exception:
+            logger.exception("Error retrieving calendar tasks for date '%s'", date)
+            return []
+    
     def get_tasks_with_due_dates_for_month(self, year: int, month: int) -> List[Task]:
         """
         Retrieve only tasks that have due dates in specified month.
@@ -0,0 +1,35 @@
+"""
+Unit tests for Energy Tracker.
+
+Run from the project root with:
+    python -m unittest discover -s tests -t .
+"""
+
+from database import DatabaseManager
+
+
+def open_memory_database() -> DatabaseManager:
+    """
+    Create a fresh DatabaseManager singleton backed by an in-memory database.
+    
+    Returns:
+        Initialized DatabaseManager using ':memory:'
+    """
+    DatabaseManager._instance = None
+    db = DatabaseManager.__new__(DatabaseManager)
+    db._db_path = ':memory:'
+    db._connection = None
+    db._initialize_database()
+    db._initialized = True
+    return db
+
+
+def close_memory_database(db: DatabaseManager) -> None:
+    """
+    Close an in-memory database and drop the singleton.
+    
+    Args:
+        db: Manager returned by open_memory_database
+    """
+    db.close()
+    DatabaseManager._instance = None
@@ -0,0 +1,195 @@
+"""
+Tests for DatabaseManager query helpers.
+"""
+
+import sqlite3
+import unittest
+
+from models import Exercise, Task
+from tests import open_memory_database, close_memory_database
+
+
+class ExecuteReturningTest(unittest.TestCase):
+    """execute_returning commits the write and hands back the returned row."""
+    
+    UPSERT_POINTS = """
+        INSERT INTO daily_points (date, physical, mental, hp)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            physical = excluded.physical,
+            mental = excluded.mental,
+            hp = excluded.hp
+        RETURNING hp
+    """
+    
+    def setUp(self):
+        self.db = open_memory_database()
+    
+    def tearDown(self):
+        close_memory_database(self.db)
+    
+    def test_insert_and_update_return_row(self):
+        row = self.db.execute_returning(self.UPSERT_POINTS, ('2024-03-10', 2, 3, 40))
+        self.assertEqual(row[0], 40)
+        
+        row = self.db.execute_returning(self.UPSERT_POINTS, ('2024-03-10', 5, 5, 70))
+        self.assertEqual(row['hp'], 70)
+    
+    def test_write_is_committed(self):
+        self.db.execute_returning(self.UPSERT_POINTS, ('2024-03-10', 2, 3, 40))
+        
+        self.assertFalse(self.db._connection.in_transaction)
+        row = self.db.fetch_one(
+            "SELECT physical, mental FROM daily_points WHERE date = ?",
+            ('2024-03-10',)
+        )
+        self.assertEqual(tuple(row), (2, 3))
+    
+    def test_no_returned_row_gives_none(self):
+        row = self.db.execute_returning(
+            "DELETE FROM daily_points WHERE date = ? RETURNING hp",
+            ('2024-03-10',)
+        )
+        self.assertIsNone(row)
+    
+    def test_failed_write_raises(self):
+        with self.assertRaises(sqlite3.Error):
+            self.db.execute_returning(self.UPSERT_POINTS, ('2024-03-10', 99, 0, 40))
+
+
+class CalendarTasksTest(unittest.TestCase):
+    """Calendar task queries match a task by its due_date OR its date."""
+    
+    def setUp(self):
+        self.db = open_memory_database()
+        
+        def add(title, date, due_date=None):
+            self.db.create_task(Task(title=title, date=date, due_date=due_date), date=date)
+        
+        add("Dated first day", '2024-02-01')
+        add("Dated last day", '2024-02-29')
+        add("Due in month", '2024-01-20', due_date='2024-02-15')
+        add("Dated in month, due later", '2024-02-10', due_date='2024-03-05')
+        add("Day before", '2024-01-31')
+        add("Day after", '2024-03-01')
+        add("Due elsewhere", '2024-01-05', due_date='2024-01-25')
+    
+    def tearDown(self):
+        close_memory_database(self.db)
+    
+    def titles(self, tasks):
+        return sorted(task.title for task in tasks)
+    
+    def test_month_matches_either_column_within_bounds(self):
+        self.assertEqual(
+            self.titles(self.db.get_calendar_tasks_for_month(2024, 2)),
+            sorted([
+                "Dated first day",
+                "Dated last day",
+                "Due in month",
+                "Dated in month, due later",
+            ])
+        )
+    
+    def test_month_differs_from_due_date_only_query(self):
+        self.assertEqual(
+            self.titles(self.db.get_tasks_by_month(2024, 2)),
+            ["Due in month"]
+        )
+    
+    def test_month_includes_day_31(self):
+        self.db.create_task(Task(title="Last of March", date='2024-03-31'), date='2024-03-31')
+        self.assertIn(
+            "Last of March",
+            self.titles(self.db.get_calendar_tasks_for_month(2024, 3))
+        )
+    
+    def test_invalid_month_raises(self):
+        for month in (0, 13):
+            with self.assertRaises(ValueError):
+                self.db.get_calendar_tasks_for_month(2024, month)
+    
+    def test_date_matches_either_column(self):
+        self.assertEqual(
+            self.titles(self.db.get_calendar_tasks_for_date('2024-02-15')),
+            ["Due in month"]
+        )
+        self.assertEqual(
+            self.titles(self.db.get_calendar_tasks_for_date('2024-02-10')),
+            ["Dated in month, due later"]
+        )
+
+
+class FetchDayBundleTest(unittest.TestCase):
+    """fetch_day_bundle must agree with the single-purpose getters."""
+    
+    def setUp(self):
+        self.db = open_memory_database()
+        
+        run_id = self.db.create_exercise(Exercise(
+            name="Run", category='cardio', color='#FF5733',
+            target_value=5, unit='km'
+        ))
+        self.db.create_exercise(Exercise(
+            name="Push-ups", category='muscle', color='#33FF57',
+            target_value=30, unit='reps'
+        ))
+        self.db.create_or_update_log(run_id, '2024-03-10', 3, False, "windy")
+        
+        self.db.create_task(
+            Task(title="Pack bag", date='2024-03-10', priority=2, category="school"),
+            date='2024-03-10'
+        )
+        self.db.create_task(
+            Task(title="Read", date='2024-03-10', is_completed=True),
+            date='2024-03-10'
+        )
+        self.db.create_task(
+            Task(title="Other day", date='2024-03-11'),
+            date='2024-03-11'
+        )
+    
+    def tearDown(self):
+        close_memory_database(self.db)
+    
+    def test_matches_individual_getters(self):
+        _, tasks, exercises, logs = self.db.fetch_day_bundle('2024-03-10')
+        
+        self.assertEqual(tasks, self.db.get_tasks_by_date('2024-03-10'))
+        self.assertEqual(exercises, self.db.get_all_exercises())
+        self.assertEqual(logs, self.db.get_logs_by_date('2024-03-10'))
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(len(logs), 1)
+    
+    def test_points_row(self):
+        self.assertIsNone(self.db.fetch_day_bundle('2024-03-10')[0])
+        
+        self.db.execute(
+            "INSERT INTO daily_points (date, physical, mental, hp) VALUES (?, ?, ?, ?)",
+            ('2024-03-10', 4, 6, 60)
+        )
+        points_row = self.db.fetch_day_bundle('2024-03-10')[0]
+        self.assertEqual(
+            (points_row['physical'], points_row['mental'], points_row['hp']),
+            (4, 6, 60)
+        )
+    
+    def test_reads_run_in_one_closed_transaction(self):
+        statements = []
+        self.db._connection.set_trace_callback(statements.append)
+        try:
+            self.db.fetch_day_bundle('2024-03-10')
+        finally:
+            self.db._connection.set_trace_callback(None)
+        
+        self.assertEqual(statements[0], "BEGIN")
+        self.assertEqual(statements[-1], "COMMIT")
+        self.assertFalse(self.db._connection.in_transaction)
+    
+    def test_rejects_invalid_date(self):
+        with self.assertRaises(ValueError):
+            self.db.fetch_day_bundle('not-a-date')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for EventManager's per-month event index.
+"""
+
+import unittest
+from datetime import date
+
+from managers.event_manager import EventManager
+from tests import open_memory_database, close_memory_database
+
+
+class MonthIndexTest(unittest.TestCase):
+    """Reads come from the month index, and every write drops it."""
+    
+    def setUp(self):
+        # update_event only looks up events within a year of today
+        today = date.today()
+        self.year, self.month = today.year, today.month
+        self.day = today.replace(day=10).isoformat()
+        self.other_day = today.replace(day=12).isoformat()
+        
+        self.db = open_memory_database()
+        self.manager = EventManager()
+        self.event_id = self.manager.create_event("Dentist", self.day)
+    
+    def tearDown(self):
+        close_memory_database(self.db)
+    
+    def titles_on(self, day):
+        return [event.title for event in self.manager.get_events_for_date(day)]
+    
+    def test_reads_fill_index(self):
+        self.assertEqual(self.manager._month_index, {})
+        self.assertEqual(self.titles_on(self.day), ["Dentist"])
+        self.assertIn((self.year, self.month), self.manager._month_index)
+    
+    def test_create_invalidates_index(self):
+        self.manager.get_events_for_month(self.year, self.month)
+        
+        self.manager.create_event("Concert", self.day)
+        
+        self.assertEqual(self.manager._month_index, {})
+        self.assertEqual(self.titles_on(self.day), ["Dentist", "Concert"])
+    
+    def test_update_invalidates_index(self):
+        self.manager.get_events_for_month(self.year, self.month)
+        
+        self.assertTrue(self.manager.update_event(self.event_id, event_date=self.other_day))
+        
+        self.assertEqual(self.manager._month_index, {})
+        self.assertEqual(self.titles_on(self.day), [])
+        self.assertEqual(self.titles_on(self.other_day), ["Dentist"])
+    
+    def test_delete_invalidates_index(self):
+        self.manager.get_dates_with_events(self.year, self.month)
+        
+        self.assertTrue(self.manager.delete_event(self.event_id))
+        
+        self.assertEqual(self.manager._month_index, {})
+        self.assertEqual(self.manager.get_dates_with_events(self.year, self.month), [])
+    
+    def test_failed_delete_keeps_index(self):
+        self.manager.get_events_for_month(self.year, self.month)
+        
+        self.assertFalse(self.manager.delete_event(self.event_id + 100))
+        
+        self.assertIn((self.year, self.month), self.manager._month_index)
+    
+    def test_invalid_date_returns_empty(self):
+        for bad_date in ('', '2024-13-01', '2024-3', 'not-a-date', None):
+            with self.assertLogs('managers.event_manager', level='WARNING'):
+                self.assertEqual(self.manager.get_events_for_date(bad_date), [])
+        self.assertEqual(self.manager._month_index, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,14 +5,23 @@ Integrates all widgets into the primary UI layout and manages
 application-level interactions with UI scaling support.
 """
 
+import logging
+import traceback
+from functools import partial
+from typing import List, Optional, Tuple
+from datetime import datetime, date
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QMenuBar, QMenu, QMessageBox, QSpinBox, QPushButton, QCheckBox, QDialog
+    QLabel, QMenuBar, QMenu, QMessageBox, QSpinBox, QPushButton, QDialog,
+    QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QFont
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, QCoreApplication
+from PyQt6.QtGui import QAction, QColor, QFont
 
+from database import DatabaseManager
 from managers import ExerciseManager, TaskManager, EventManager
+from models import Exercise, ExerciseLog, Task
 from .widgets import (
     RingChartWidget,
     CalendarWidget,
@@ -22,10 +31,108 @@ from .widgets import (
 from .settings_dialog import SettingsDialog
 from .task_manager_window import TaskManagerWindow
 from .exercise_manager_window import ExerciseManagerWindow
-from utils import APP_NAME, APP_VERSION, DEFAULT_EXERCISES, get_today, SettingsManager
+from utils import APP_NAME, APP_VERSION, DEFAULT_EXERCISES, get_today, SettingsManager, ReportGenerator
 from .monthly_hp_tracker_window import MonthlyHPTrackerWindow
 from PyQt6.QtWidgets import QApplication
 
+logger = logging.getLogger(__name__)
+
+# Checked state value compared against on every summary toggle
+_CHECKED = Qt.CheckState.Checked.value
+
+# About dialog content; app name and version are fixed at import
+_ABOUT_TITLE = f"About {APP_NAME}"
+_ABOUT_HTML = f"""
+    <h2>{APP_NAME}</h2>
+    <p>Version {APP_VERSION}</p>
+    <p>A personal energy and productivity tracking application.</p>
+    <p><b>Features:</b></p>
+    <ul>
+        <li>Exercise tracking with progress visualization</li>
+        <li>Task checklist management</li>
+        <li>Calendar event organization</li>
+        <li>Ring chart progress display</li>
+        <li>Customizable interface scaling and text size</li>
+    </ul>
+    <p>Built with Python and PyQt6</p>
+"""
+
+# Dark theme for the main window
+_MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #1E1E1E;
+    }
+    QWidget {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+    }
+    QLabel {
+        color: #FFFFFF;
+    }
+    QPushButton {
+        background-color: #4ECDC4;
+        color: #000000;
+        border: none;
+        padding: 14px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #6FE4DB;
+    }
+    QPushButton:pressed {
+        background-color: #3DB8AF;
+    }
+    QListWidget {
+        background-color: #2D2D2D;
+        border: 1px solid #555555;
+        border-radius: 4px;
+    }
+    QListWidget::item {
+        padding: 5px;
+    }
+    QListWidget::item:hover {
+        background-color: #3D3D3D;
+    }
+"""
+
+# Summary list styling, set once per list instead of per row: white
+# indicator, task/exercise specific checked color
+_TASK_LIST_CSS = """
+    QListWidget {
+        color: white;
+    }
+    QListWidget::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid white;
+        border-radius: 3px;
+        background-color: transparent;
+    }
+    QListWidget::indicator:checked {
+        background-color: #4ECDC4;
+        border: 2px solid white;
+    }
+"""
+
+_EXERCISE_LIST_CSS = """
+    QListWidget {
+        color: white;
+    }
+    QListWidget::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid white;
+        border-radius: 3px;
+        background-color: transparent;
+    }
+    QListWidget::indicator:checked {
+        background-color: #32CD32;
+        border: 2px solid white;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     """
     Main application window.
@@ -44,11 +151,13 @@ class MainWindow(QMainWindow):
         self._task_manager = TaskManager()
         self._event_manager = EventManager()
         
+        # Shared database handle for daily points
+        self._db = DatabaseManager()
+        
         # Initialize settings
         self._settings = SettingsManager()
         
         # Initialize report generator
-        from utils import ReportGenerator
         self._report_generator = ReportGenerator(
             self._exercise_manager,
             self._task_manager
@@ -63,14 +172,47 @@ class MainWindow(QMainWindow):
         # Track current selected date (defaults to today)
         self._current_date = get_today()
         
+        # Scale last passed to _scale_widgets, to skip no-op relayouts
+        self._last_applied_scale: Optional[float] = None
+        
+        # Shared fonts, built once and reused
+        self._title_font = QFont()
+        self._title_font.setPointSize(16)
+        self._title_font.setBold(True)
+        self._base_font = QFont()
+        self._base_font.setFamily("Segoe UI")
+        
+        # Debounce calendar selection so rapid clicks/arrow navigation
+        # only load the date the user finally lands on
+        self._date_timer = QTimer(self)
+        self._date_timer.setSingleShot(True)
+        self._date_timer.setInterval(80)
+        self._date_timer.timeout.connect(lambda: self._load_date_data(self._current_date))
+        
+        # Coalesce bursts of data_changed emissions (e.g. add then save)
+        # into a single summary rebuild of the selected date on the next
+        # event loop pass
+        self._task_refresh_timer = QTimer(self)
+        self._task_refresh_timer.setSingleShot(True)
+        self._task_refresh_timer.setInterval(0)
+        self._task_refresh_timer.timeout.connect(
+            lambda: self._update_task_summary_for_date(self._current_date)
+        )
+        self._exercise_refresh_timer = QTimer(self)
+        self._exercise_refresh_timer.setSingleShot(True)
+        self._exercise_refresh_timer.setInterval(0)
+        self._exercise_refresh_timer.timeout.connect(
+            lambda: self._update_exercise_summary_for_date(self._current_date)
+        )
+        
         self._setup_ui()
         self._create_menu_bar()
         self._connect_signals()
         self._apply_settings()
-        self._initialize_default_data()
         
-        # Load data for current date (today by default)
-        self._load_date_data(self._current_date)
+        # Default data and the first date load run after the window has
+        # been shown (see showEvent)
+        self._initial_load_done = False
     
     def _setup_ui(self) -> None:
         """Initialize main window UI and layout."""
@@ -81,43 +223,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(width, height)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1E1E1E;
-            }
-            QWidget {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-            }
-            QLabel {
-                color: #FFFFFF;
-            }
-            QPushButton {
-                background-color: #4ECDC4;
-                color: #000000;
-                border: none;
-                padding: 14px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6FE4DB;
-            }
-            QPushButton:pressed {
-                background-color: #3DB8AF;
-            }
-            QListWidget {
-                background-color: #2D2D2D;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:hover {
-                background-color: #3D3D3D;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
         
         # Central widget
         central_widget = QWidget()
@@ -150,10 +256,7 @@ class MainWindow(QMainWindow):
         
         # Header with title only (date label removed)
         points_title = QLabel("Daily Points")
-        points_title_font = QFont()
-        points_title_font.setPointSize(16)
-        points_title_font.setBold(True)
-        points_title.setFont(points_title_font)
+        points_title.setFont(self._title_font)
         points_layout.addWidget(points_title)
         
         # Points input row
@@ -198,12 +301,17 @@ class MainWindow(QMainWindow):
         task_summary_group = QWidget()
         task_summary_layout = QVBoxLayout(task_summary_group)
         task_summary_title = QLabel("Tasks")
-        task_summary_title.setFont(points_title_font)
+        task_summary_title.setFont(self._title_font)
         task_summary_layout.addWidget(task_summary_title)
         
-        # Task checklist (simple checkboxes showing today's tasks)
-        self.task_checklist_layout = QVBoxLayout()
-        task_summary_layout.addLayout(self.task_checklist_layout)
+        # Task checklist (checkable items showing the selected date's tasks)
+        self.task_list = QListWidget()
+        # Rows are single-line text, so the view can size them all from one
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.setStyleSheet(_TASK_LIST_CSS)
+        self.task_list.itemChanged.connect(self._on_task_item_changed)
+        self._task_list_signature: Optional[tuple] = None
+        task_summary_layout.addWidget(self.task_list)
         
         task_manage_button = QPushButton("Manage Tasks")
         task_manage_button.clicked.connect(self._open_task_manager)
@@ -214,12 +322,16 @@ class MainWindow(QMainWindow):
         exercise_summary_group = QWidget()
         exercise_summary_layout = QVBoxLayout(exercise_summary_group)
         exercise_summary_title = QLabel("Exercises")
-        exercise_summary_title.setFont(points_title_font)
+        exercise_summary_title.setFont(self._title_font)
         exercise_summary_layout.addWidget(exercise_summary_title)
         
-        # Exercise checklist (simple checkboxes)
-        self.exercise_checklist_layout = QVBoxLayout()
-        exercise_summary_layout.addLayout(self.exercise_checklist_layout)
+        # Exercise checklist (checkable items)
+        self.exercise_list = QListWidget()
+        self.exercise_list.setUniformItemSizes(True)
+        self.exercise_list.setStyleSheet(_EXERCISE_LIST_CSS)
+        self.exercise_list.itemChanged.connect(self._on_exercise_item_changed)
+        self._exercise_list_signature: Optional[tuple] = None
+        exercise_summary_layout.addWidget(self.exercise_list)
         
         exercise_manage_button = QPushButton("Manage Exercises")
         exercise_manage_button.clicked.connect(self._open_exercise_manager)
@@ -292,8 +404,8 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         """Connect inter-widget signals."""
         # Update summaries when data changes
-        self._task_manager.data_changed.connect(self._update_task_summary)
-        self._exercise_manager.data_changed.connect(self._update_exercise_summary)
+        self._task_manager.data_changed.connect(self._task_refresh_timer.start)
+        self._exercise_manager.data_changed.connect(self._exercise_refresh_timer.start)
         
         # When calendar date is selected, could update other widgets
         self.calendar.date_selected.connect(self._on_date_selected)
@@ -302,11 +414,25 @@ class MainWindow(QMainWindow):
         """
         Handle calendar date selection - load all data for that date.
         
+        Loading is deferred through a short single-shot timer so a burst
+        of selections triggers only one reload.
+        
         Args:
             date_str: Selected date in ISO format (YYYY-MM-DD)
         """
         self._current_date = date_str
-        self._load_date_data(date_str)
+        self._date_timer.start()
+    
+    def _flush_pending_date_load(self) -> None:
+        """
+        Run a debounced date load now if one is still pending.
+        
+        Called before anything that reads the inputs or lists for
+        self._current_date, which may still show the previous date.
+        """
+        if self._date_timer.isActive():
+            self._date_timer.stop()
+            self._load_date_data(self._current_date)
     
     def _load_date_data(self, date_str: str) -> None:
         """
@@ -316,23 +442,17 @@ class MainWindow(QMainWindow):
             date_str: Date in ISO format (YYYY-MM-DD)
         """
         try:
-            from database import DatabaseManager
-            db = DatabaseManager()
-            
-            # Load daily points from database
-            result = db.fetch_one("""
-                SELECT physical, mental, hp, updated_at
-                FROM daily_points
-                WHERE date = ?
-            """, (date_str,))
+            # Load daily points, tasks and exercise logs in one batch
+            result, tasks, exercises, logs = self._db.fetch_day_bundle(date_str)
             
             if result:
                 # Found existing data for this date
                 physical, mental, hp, updated_at = result
                 
-                # Update spinboxes
-                self.physical_input.setValue(physical)
-                self.mental_input.setValue(mental)
+                # Update spinboxes without emitting valueChanged
+                with QSignalBlocker(self.physical_input), QSignalBlocker(self.mental_input):
+                    self.physical_input.setValue(physical)
+                    self.mental_input.setValue(mental)
                 
                 # Update current points
                 self._current_points = {
@@ -343,11 +463,13 @@ class MainWindow(QMainWindow):
                 # Update ring chart
                 self.ring_chart.update_from_points(self._current_points)
                 
-                print(f"Loaded data for {date_str} (last updated: {updated_at})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Loaded data for %s (last updated: %s)", date_str, updated_at)
             else:
                 # No data for this date - reset to defaults
-                self.physical_input.setValue(0)
-                self.mental_input.setValue(0)
+                with QSignalBlocker(self.physical_input), QSignalBlocker(self.mental_input):
+                    self.physical_input.setValue(0)
+                    self.mental_input.setValue(0)
                 
                 self._current_points = {
                     'physical': 0,
@@ -356,23 +478,24 @@ class MainWindow(QMainWindow):
                 
                 self.ring_chart.update_from_points(self._current_points)
                 
-                print(f"No data for {date_str} - showing defaults")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("No data for %s - showing defaults", date_str)
             
             # Update exercise display for selected date
-            self._update_exercise_summary_for_date(date_str)
+            self._update_exercise_summary_for_date(
+                date_str,
+                exercises_data=self._exercise_manager.combine_logs(date_str, exercises, logs)
+            )
             
             # Update task display for selected date
-            self._update_task_summary_for_date(date_str)
+            self._update_task_summary_for_date(date_str, tasks=tasks)
             
-        except Exception as e:
-            print(f"Error loading date data: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error loading date data for %s", date_str)
             
     def _open_monthly_hp_tracker(self) -> None:
         """Open Monthly HP Tracker window."""
         try:
-            from datetime import date
             today = date.today()
             
             dialog = MonthlyHPTrackerWindow(
@@ -389,18 +512,18 @@ class MainWindow(QMainWindow):
                 f"Failed to open HP Tracker:\n{str(e)}"
             )
             print(f"Error opening HP tracker: {e}")
-            import traceback
             traceback.print_exc()
 
     def _save_daily_points(self) -> None:
         """Save daily points input for current selected date and update ring chart."""
+        # The spinboxes must hold the selected date's values before saving
+        self._flush_pending_date_load()
+        
         physical = self.physical_input.value()
         mental = self.mental_input.value()
         
-        # Calculate HP
-        raw_hp = physical + mental  # 0-20
-        hp = 20 + (raw_hp * 4)   
-        hp = max(20, min(100, hp))
+        # Calculate HP (integer math): 20 + (0-20 raw points) * 4, clamped to 20-100
+        hp = max(20, min(100, 20 + (physical + mental) * 4))
         
         # Store points for ring chart
         self._current_points = {
@@ -410,15 +533,11 @@ class MainWindow(QMainWindow):
         
         # Save to database with timestamp for CURRENT SELECTED DATE
         try:
-            from database import DatabaseManager
-            from datetime import datetime
-            
-            db = DatabaseManager()
             target_date = self._current_date  # Use selected date, not today
             now = datetime.now().isoformat()
             
-            # UPSERT daily points
-            db.execute("""
+            # UPSERT daily points; the stored hp comes back in the same round trip
+            row = self._db.execute_returning("""
                 INSERT INTO daily_points (date, physical, mental, hp, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?)
                 ON CONFLICT(date) DO UPDATE SET
@@ -426,7 +545,10 @@ class MainWindow(QMainWindow):
                     mental = excluded.mental,
                     hp = excluded.hp,
                     updated_at = excluded.updated_at
+                RETURNING hp
             """, (target_date, physical, mental, hp, now, now))
+            if row is not None:
+                hp = row[0]
             
             print(f"Saved points for {target_date} at {now}: P={physical}, M={mental}, HP={hp}")
             
@@ -434,164 +556,239 @@ class MainWindow(QMainWindow):
             print(f"Error saving daily points: {e}")
         
         # Update ring chart with new points (no popup)
-        self.ring_chart.update_from_points(self._current_points)
+        self.ring_chart.update_from_points(self._current_points, hp=hp)
     
     def _update_task_summary(self) -> None:
         """Update task summary display for TODAY."""
         self._update_task_summary_for_date(get_today())
     
-    def _update_task_summary_for_date(self, date_str: str) -> None:
+    def _update_task_summary_for_date(
+        self,
+        date_str: str,
+        tasks: Optional[List[Task]] = None
+    ) -> None:
         """
         Update task checklist display for a specific date.
         
+        Items are rebuilt in one batch with list signals and repaints
+        suspended; when the task list is unchanged only check states
+        are synced.
+        
         Args:
             date_str: Date in ISO format (YYYY-MM-DD)
+            tasks: Tasks for the date if already fetched; queried otherwise
         """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_update_task_summary_for_date called with: %s", date_str)
+        
+        # Get tasks for specific date from TaskManager
         try:
-            print(f"[MainWindow] _update_task_summary_for_date called with: {date_str}")
-            
-            # Clear existing checkboxes
-            while self.task_checklist_layout.count():
-                child = self.task_checklist_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            # Get tasks for specific date from TaskManager
-            try:
+            if tasks is None:
                 tasks = self._task_manager.get_tasks_by_date(date_str)
-                print(f"[MainWindow] Loaded {len(tasks)} tasks for {date_str}")
-            except Exception as e:
-                print(f"[MainWindow] ERROR fetching tasks: {e}")
-                import traceback
-                traceback.print_exc()
-                error_label = QLabel(f"Error loading tasks")
-                error_label.setStyleSheet("color: #FF6B6B;")
-                self.task_checklist_layout.addWidget(error_label)
-                return
-            
-            if not tasks:
-                no_task_label = QLabel(f"No tasks for {date_str}")
-                no_task_label.setStyleSheet("color: #AAAAAA;")
-                self.task_checklist_layout.addWidget(no_task_label)
-                return
-            
-            # Create checkbox for each task
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loaded %d tasks for %s", len(tasks), date_str)
+        except Exception:
+            logger.exception("Error fetching tasks for %s", date_str)
+            self._task_list_signature = None
+            self._show_status(self.task_list, "Error loading tasks", "#FF6B6B")
+            return
+        
+        # Same date and same task list as currently shown: only the
+        # completion states can differ, so skip the rebuild
+        signature = (date_str, tuple((t.id, t.title, t.category) for t in tasks))
+        if signature == self._task_list_signature:
+            self._sync_checked(self.task_list, [t.is_completed for t in tasks])
+            return
+        
+        if not tasks:
+            self._task_list_signature = signature
+            self._show_status(self.task_list, f"No tasks for {date_str}", "#AAAAAA")
+            return
+        
+        # setCheckState emits itemChanged, so keep the list quiet while
+        # items are added
+        self.task_list.setUpdatesEnabled(False)
+        self.task_list.blockSignals(True)
+        try:
+            self.task_list.clear()
             for task in tasks:
-                try:
-                    display_text = f"{task.title}"
-                    if task.category:
-                        display_text += f" ({task.category})"
-                    
-                    checkbox = QCheckBox(display_text)
-                    checkbox.setChecked(task.is_completed)
-                    
-                    # White checkbox styling, 16pt font
-                    checkbox.setStyleSheet("""
-                        QCheckBox {
-                            color: white;
-                        }
-                        QCheckBox::indicator {
-                            width: 18px;
-                            height: 18px;
-                            border: 2px solid white;
-                            border-radius: 3px;
-                            background-color: transparent;
-                        }
-                        QCheckBox::indicator:checked {
-                            background-color: #4ECDC4;
-                            border: 2px solid white;
-                        }
-                    """)
-                    
-                    # Connect to update handler for current date
-                    checkbox.stateChanged.connect(
-                        lambda state, tid=task.id: self._on_task_toggled_on_home(tid, state)
-                    )
-                    
-                    self.task_checklist_layout.addWidget(checkbox)
-                    print(f"[MainWindow] Added checkbox for task: {task.title}")
-                    
-                except Exception as e:
-                    print(f"[MainWindow] ERROR creating checkbox for task {task.id}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                display_text = f"{task.title}"
+                if task.category:
+                    display_text += f" ({task.category})"
+                
+                item = QListWidgetItem(display_text)
+                item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(
+                    Qt.CheckState.Checked if task.is_completed else Qt.CheckState.Unchecked
+                )
+                # The shared itemChanged slot reads the task id back from here
+                item.setData(Qt.ItemDataRole.UserRole, task.id)
+                self.task_list.addItem(item)
             
-        except Exception as e:
-            print(f"[MainWindow] ERROR in _update_task_summary_for_date: {e}")
-            import traceback
-            traceback.print_exc()
-            error_label = QLabel("Error loading tasks")
-            error_label.setStyleSheet("color: #FF6B6B;")
-            self.task_checklist_layout.addWidget(error_label)
+            self._task_list_signature = signature
+            
+        except Exception:
+            logger.exception("Error updating task summary for %s", date_str)
+            self._task_list_signature = None
+            self.task_list.clear()
+            self.task_list.addItem(self._status_item("Error loading tasks", "#FF6B6B"))
+        finally:
+            self.task_list.blockSignals(False)
+            self.task_list.setUpdatesEnabled(True)
     
     def _update_exercise_summary(self) -> None:
         """Update exercise checklist display with checkboxes for TODAY."""
         self._update_exercise_summary_for_date(get_today())
     
-    def _update_exercise_summary_for_date(self, date_str: str) -> None:
+    def _update_exercise_summary_for_date(
+        self,
+        date_str: str,
+        exercises_data: Optional[List[Tuple[Exercise, ExerciseLog]]] = None
+    ) -> None:
         """
         Update exercise checklist display for a specific date.
         
+        Items are rebuilt in one batch; when the exercise list is
+        unchanged only progress text and check states are refreshed.
+        
         Args:
             date_str: Date in ISO format (YYYY-MM-DD)
+            exercises_data: (Exercise, ExerciseLog) pairs if already
+                fetched; queried otherwise
         """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_update_exercise_summary_for_date called with: %s", date_str)
+        
+        self.exercise_list.setUpdatesEnabled(False)
+        self.exercise_list.blockSignals(True)
         try:
-            print(f"[MainWindow] _update_exercise_summary_for_date called with: {date_str}")
+            # Get exercises for specified date
+            if exercises_data is None:
+                exercises_data = self._exercise_manager.get_logs_for_date(date_str)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loaded %d exercises for %s", len(exercises_data), date_str)
             
-            # Clear existing checkboxes
-            while self.exercise_checklist_layout.count():
-                child = self.exercise_checklist_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
+            # Same date and same exercises as currently shown: refresh the
+            # progress text and completion states in place
+            signature = (
+                date_str,
+                tuple((ex.id, ex.name, log.target_value, log.unit) for ex, log in exercises_data)
+            )
+            if signature == self._exercise_list_signature:
+                for row, (exercise, log) in enumerate(exercises_data):
+                    item = self.exercise_list.item(row)
+                    item.setText(f"{exercise.name} - {log.actual_value}/{log.target_value} {log.unit}")
+                    item.setCheckState(
+                        Qt.CheckState.Checked if log.completed else Qt.CheckState.Unchecked
+                    )
+                return
             
-            # Get exercises for specified date
-            exercises_data = self._exercise_manager.get_logs_for_date(date_str)
-            print(f"[MainWindow] Loaded {len(exercises_data)} exercises for {date_str}")
+            self.exercise_list.clear()
+            self._exercise_list_signature = signature
             
             if not exercises_data:
-                no_exercise_label = QLabel(f"No exercises for {date_str}")
-                no_exercise_label.setStyleSheet("color: #AAAAAA;")
-                self.exercise_checklist_layout.addWidget(no_exercise_label)
+                self.exercise_list.addItem(
+                    self._status_item(f"No exercises for {date_str}", "#AAAAAA")
+                )
                 return
             
-            # Create checkbox for each exercise
             for exercise, log in exercises_data:
-                checkbox = QCheckBox(f"{exercise.name} - {log.actual_value}/{log.target_value} {log.unit}")
-                checkbox.setChecked(log.completed)
-                
-                # White checkbox styling, 16pt font
-                checkbox.setStyleSheet("""
-                    QCheckBox {
-                        color: white;
-                    }
-                    QCheckBox::indicator {
-                        width: 18px;
-                        height: 18px;
-                        border: 2px solid white;
-                        border-radius: 3px;
-                        background-color: transparent;
-                    }
-                    QCheckBox::indicator:checked {
-                        background-color: #32CD32;
-                        border: 2px solid white;
-                    }
-                """)
-                
-                # Connect to update handler for current date
-                checkbox.stateChanged.connect(
-                    lambda state, eid=exercise.id, d=date_str: self._on_exercise_toggled_for_date(eid, state, d)
+                item = QListWidgetItem(
+                    f"{exercise.name} - {log.actual_value}/{log.target_value} {log.unit}"
                 )
+                item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(
+                    Qt.CheckState.Checked if log.completed else Qt.CheckState.Unchecked
+                )
+                # The shared itemChanged slot reads exercise id and date back from here
+                item.setData(Qt.ItemDataRole.UserRole, (exercise.id, date_str))
+                self.exercise_list.addItem(item)
                 
-                self.exercise_checklist_layout.addWidget(checkbox)
-                print(f"[MainWindow] Added checkbox for exercise: {exercise.name}")
-                
-        except Exception as e:
-            print(f"[MainWindow] ERROR in _update_exercise_summary_for_date: {e}")
-            import traceback
-            traceback.print_exc()
-            no_exercise_label = QLabel("Error loading exercises")
-            no_exercise_label.setStyleSheet("color: #FF6B6B;")
-            self.exercise_checklist_layout.addWidget(no_exercise_label)
+        except Exception:
+            logger.exception("Error updating exercise summary for %s", date_str)
+            self._exercise_list_signature = None
+            self.exercise_list.clear()
+            self.exercise_list.addItem(self._status_item("Error loading exercises", "#FF6B6B"))
+        finally:
+            self.exercise_list.blockSignals(False)
+            self.exercise_list.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _sync_checked(list_widget: QListWidget, states: List[bool]) -> None:
+        """
+        Set check states on existing list items without emitting itemChanged.
+        
+        Args:
+            list_widget: Summary list, in display order
+            states: Checked state for each item
+        """
+        with QSignalBlocker(list_widget):
+            for row, checked in enumerate(states):
+                list_widget.item(row).setCheckState(
+                    Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+                )
+    
+    @staticmethod
+    def _status_item(text: str, color: str) -> QListWidgetItem:
+        """
+        Build a non-checkable placeholder/status row.
+        
+        Args:
+            text: Message to display
+            color: Hex text color
+        
+        Returns:
+            QListWidgetItem without user data, ignored by the toggle slots
+        """
+        item = QListWidgetItem(text)
+        item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        item.setForeground(QColor(color))
+        return item
+    
+    def _show_status(self, list_widget: QListWidget, text: str, color: str) -> None:
+        """
+        Replace a summary list's contents with a single status message.
+        
+        Args:
+            list_widget: Summary list to update
+            text: Message to display
+            color: Hex text color
+        """
+        with QSignalBlocker(list_widget):
+            list_widget.clear()
+            list_widget.addItem(self._status_item(text, color))
+    
+    def _on_task_item_changed(self, item: QListWidgetItem) -> None:
+        """
+        Shared itemChanged slot for the task summary list.
+        
+        Args:
+            item: Item whose check state was toggled
+        """
+        task_id = item.data(Qt.ItemDataRole.UserRole)
+        if task_id is None:
+            return
+        # The handler rebuilds the list, so run it after the view has
+        # finished processing this item
+        QTimer.singleShot(
+            0, partial(self._on_task_toggled_on_home, task_id, item.checkState().value)
+        )
+    
+    def _on_exercise_item_changed(self, item: QListWidgetItem) -> None:
+        """
+        Shared itemChanged slot for the exercise summary list.
+        
+        Args:
+            item: Item whose check state was toggled
+        """
+        data = item.data(Qt.ItemDataRole.UserRole)
+        if data is None:
+            return
+        exercise_id, date_str = data
+        QTimer.singleShot(
+            0,
+            partial(self._on_exercise_toggled_for_date, exercise_id, item.checkState().value, date_str)
+        )
     
     def _on_home_exercise_toggled(self, exercise_id: int, state: int) -> None:
         """
@@ -612,13 +809,15 @@ class MainWindow(QMainWindow):
             state: Qt.CheckState value
             date_str: Date in ISO format
         """
+        self._flush_pending_date_load()
+        
         try:
-            is_checked = (state == Qt.CheckState.Checked.value)
+            is_checked = (state == _CHECKED)
             
             # Get current exercise to get target_value
             exercise = self._exercise_manager.get_exercise_by_id(exercise_id)
             if not exercise:
-                print(f"Exercise {exercise_id} not found")
+                logger.warning("Exercise %s not found", exercise_id)
                 return
             
             # Update completion status
@@ -636,14 +835,12 @@ class MainWindow(QMainWindow):
             # Refresh display for current date
             self._update_exercise_summary_for_date(date_str)
             
-            # Only refresh ring chart if editing current selected date
-            if date_str == self._current_date:
-                self.ring_chart._load_data()
+            # The ring chart is driven by daily points, not exercise logs,
+            # and already refreshes itself from ExerciseManager.log_updated,
+            # so no explicit reload is needed here
             
-        except Exception as e:
-            print(f"Error toggling exercise for {date_str}: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error toggling exercise for %s", date_str)
     
     def _on_task_toggled_on_home(self, task_id: int, state: int) -> None:
         """
@@ -653,9 +850,9 @@ class MainWindow(QMainWindow):
             task_id: Task being toggled
             state: Qt.CheckState value
         """
+        self._flush_pending_date_load()
+        
         try:
-            is_checked = (state == Qt.CheckState.Checked.value)
-            
             # Update task completion status
             self._task_manager.toggle_task_completion(task_id)
             
@@ -683,7 +880,8 @@ class MainWindow(QMainWindow):
         self.ring_chart._load_data()  # Refresh ring chart
     
     def _refresh_all_widgets(self) -> None:
-        """Refresh all data displays."""
+        """Refresh all data displays with a single repaint."""
+        self.setUpdatesEnabled(False)
         try:
             self.ring_chart._load_data()
             self.calendar._load_events()
@@ -691,6 +889,9 @@ class MainWindow(QMainWindow):
             self._update_exercise_summary()
         except Exception as e:
             print(f"Error refreshing widgets: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _initialize_default_data(self) -> None:
         """Initialize database with default exercises if empty."""
@@ -753,14 +954,10 @@ class MainWindow(QMainWindow):
         adjusted_size = int(base_size * scale) + text_offset
         adjusted_size = max(8, adjusted_size)
         
-        # Create new font
-        from PyQt6.QtGui import QFont
-        from PyQt6.QtCore import QCoreApplication
-        
+        # Reuse the cached base font, only its size changes
         app = QApplication.instance()
         
-        base_font = QFont()
-        base_font.setFamily("Segoe UI")
+        base_font = self._base_font
         base_font.setPointSize(adjusted_size)
         
         # ========== CRITICAL: Apply font WITHOUT stylesheet interference ==========
@@ -815,39 +1012,36 @@ class MainWindow(QMainWindow):
         Args:
             scale: Scale multiplier
         """
-        # Scale ring chart
-        base_ring_size = 400
-        scaled_size = int(base_ring_size * scale)
-        self.ring_chart.setFixedSize(scaled_size, scaled_size)
+        # Re-applying the same fixed sizes would still invalidate layouts
+        if scale == self._last_applied_scale:
+            return
         
-        # Scale calendar width
-        base_calendar_width = 1050
-        scaled_width = int(base_calendar_width * scale)
-        self.calendar.setFixedWidth(scaled_width)
-        
-        # Adjust spacing
-        base_spacing = 15
-        scaled_spacing = int(base_spacing * scale)
-        self.centralWidget().layout().setSpacing(scaled_spacing)
+        # Apply all three size changes behind one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Scale ring chart
+            base_ring_size = 400
+            scaled_size = int(base_ring_size * scale)
+            self.ring_chart.setFixedSize(scaled_size, scaled_size)
+            
+            # Scale calendar width
+            base_calendar_width = 1050
+            scaled_width = int(base_calendar_width * scale)
+            self.calendar.setFixedWidth(scaled_width)
+            
+            # Adjust spacing
+            base_spacing = 15
+            scaled_spacing = int(base_spacing * scale)
+            self.centralWidget().layout().setSpacing(scaled_spacing)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+        
+        self._last_applied_scale = scale
     
     def _show_about_dialog(self) -> None:
         """Display about dialog."""
-        about_text = f"""
-        <h2>{APP_NAME}</h2>
-        <p>Version {APP_VERSION}</p>
-        <p>A personal energy and productivity tracking application.</p>
-        <p><b>Features:</b></p>
-        <ul>
-            <li>Exercise tracking with progress visualization</li>
-            <li>Task checklist management</li>
-            <li>Calendar event organization</li>
-            <li>Ring chart progress display</li>
-            <li>Customizable interface scaling and text size</li>
-        </ul>
-        <p>Built with Python and PyQt6</p>
-        """
-        
-        QMessageBox.about(self, f"About {APP_NAME}", about_text)
+        QMessageBox.about(self, _ABOUT_TITLE, _ABOUT_HTML)
     
     def _generate_daily_report(self) -> None:
         """Generate and save daily report."""
@@ -868,12 +1062,33 @@ class MainWindow(QMainWindow):
             )
             
         except Exception as e:
+            logger.exception("Error generating daily report")
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Failed to generate report:\n{str(e)}"
+                f"Failed to generate report:\n{e}"
             )
     
+    def showEvent(self, event) -> None:
+        """
+        Schedule the initial data load on first show.
+        
+        Args:
+            event: QShowEvent
+        """
+        super().showEvent(event)
+        if not self._initial_load_done:
+            self._initial_load_done = True
+            # Let the first paint happen before touching the database
+            QTimer.singleShot(0, self._post_show_init)
+    
+    def _post_show_init(self) -> None:
+        """Create default data and load the current date after first show."""
+        self._initialize_default_data()
+        
+        # Load data for current date (today by default)
+        self._load_date_data(self._current_date)
+    
     def closeEvent(self, event) -> None:
         """
         Handle application close event.
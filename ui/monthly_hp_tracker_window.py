@@ -4,20 +4,92 @@ Monthly HP Tracker Window.
 Dialog displaying HP data for a selected month with navigation controls.
 """
 
-from typing import Dict, Optional
+import logging
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from datetime import date, timedelta
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont
 
 from database import DatabaseManager
 from models.hp_data import HPData
 from ui.widgets.monthly_hp_ring import MonthlyHPRingWidget
 
+logger = logging.getLogger(__name__)
+
+# Dark theme for the dialog
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2D2D2D;
+    }
+    QLabel {
+        color: #FFFFFF;
+    }
+    QPushButton {
+        background-color: #4ECDC4;
+        color: #000000;
+        border: none;
+        padding: 14px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #6FE4DB;
+    }
+"""
+
+# Day detail panel
+_DETAIL_QSS = """
+    QWidget {
+        background-color: #3D3D3D;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 15px;
+    }
+"""
+
+# Detail panel colors by HP band; _HP_UPPER_BOUNDS[i] is the highest HP
+# drawn in _HP_COLORS[i], anything above the last bound uses the last color
+_HP_UPPER_BOUNDS = (20, 40, 55, 75, 83)
+_HP_COLORS = (
+    '#B0B0B0',  # Light Gray (None/Default)
+    '#FF6B6B',  # Red (Very Low)
+    '#FFBE57',  # Orange (Low)
+    '#B7E6B9',  # Light Green (Moderate)
+    '#68CC6D',  # Green (High)
+    '#1FDE28',  # Bright Green (Maximum)
+)
+_DETAIL_STYLES = {color: f"color: {color}; font-size: 16px;" for color in _HP_COLORS}
+
+# Detail panel text shown until a day is picked
+_DETAIL_PROMPT = "Click on a day to view details"
+
+# Month of daily points; SQLite returns the day of month directly and
+# the primary key on daily_points.date serves the range scan
+_MONTH_POINTS_SQL = """
+    SELECT CAST(substr(date, 9, 2) AS INTEGER) AS day,
+           date, hp, physical, mental
+    FROM daily_points
+    WHERE date BETWEEN ? AND ?
+    ORDER BY date ASC
+"""
+
+# Number of recently visited months kept in memory per window
+_MONTH_CACHE_SIZE = 12
+
+# Index 0 unused so months index directly (1-12)
+_MONTH_NAMES = (
+    '', 'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
 
 class MonthlyHPTrackerWindow(QDialog):
     """
@@ -44,6 +116,8 @@ class MonthlyHPTrackerWindow(QDialog):
         super().__init__(parent)
         
         self._db = DatabaseManager()
+        # One cursor reused for every month query of this window
+        self._cursor = self._db._connection.cursor()
         
         # Set initial date
         today = date.today()
@@ -52,6 +126,18 @@ class MonthlyHPTrackerWindow(QDialog):
         
         self._hp_data: Dict[int, HPData] = {}
         
+        # (year, month) -> (hp_data, days_in_month), least recently used first.
+        # The window is opened modally and rebuilt on each open, so points
+        # cannot change underneath an instance's cache.
+        self._month_cache: "OrderedDict[Tuple[int, int], Tuple[Dict[int, HPData], int]]" = OrderedDict()
+        self._shown_month: Optional[Tuple[int, int]] = None
+        
+        # Rapid prev/next clicks only load the month the user stops on
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(50)
+        self._load_timer.timeout.connect(self._load_month_data)
+        
         self.setWindowTitle("HP Tracker")
         self.setModal(False)
         self.setMinimumSize(900, 950)
@@ -66,26 +152,7 @@ class MonthlyHPTrackerWindow(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2D2D2D;
-            }
-            QLabel {
-                color: #FFFFFF;
-            }
-            QPushButton {
-                background-color: #4ECDC4;
-                color: #000000;
-                border: none;
-                padding: 14px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #6FE4DB;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         # Header section
         header_layout = QVBoxLayout()
@@ -102,7 +169,7 @@ class MonthlyHPTrackerWindow(QDialog):
         nav_layout = QHBoxLayout()
         
         self.prev_button = QPushButton("◀ Prev")
-        self.prev_button.clicked.connect(lambda: self._navigate_month(-1))
+        self.prev_button.clicked.connect(self._prev_month)
         
         self.month_label = QLabel()
         month_font = QFont()
@@ -112,7 +179,7 @@ class MonthlyHPTrackerWindow(QDialog):
         self._update_month_label()
         
         self.next_button = QPushButton("Next ▶")
-        self.next_button.clicked.connect(lambda: self._navigate_month(1))
+        self.next_button.clicked.connect(self._next_month)
         
         nav_layout.addWidget(self.prev_button)
         nav_layout.addStretch()
@@ -129,14 +196,7 @@ class MonthlyHPTrackerWindow(QDialog):
         
         # Detail panel
         detail_container = QWidget()
-        detail_container.setStyleSheet("""
-            QWidget {
-                background-color: #3D3D3D;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 15px;
-            }
-        """)
+        detail_container.setStyleSheet(_DETAIL_QSS)
         detail_layout = QVBoxLayout(detail_container)
         
         detail_header = QLabel("Selected Day Details")
@@ -145,7 +205,7 @@ class MonthlyHPTrackerWindow(QDialog):
         detail_header_font.setBold(True)
         detail_header.setFont(detail_header_font)
         
-        self.detail_label = QLabel("Click on a day to view details")
+        self.detail_label = QLabel(_DETAIL_PROMPT)
         self.detail_label.setStyleSheet("color: #AAAAAA; font-size: 16px;")
         self.detail_label.setWordWrap(True)
         
@@ -159,79 +219,106 @@ class MonthlyHPTrackerWindow(QDialog):
     
     def _update_month_label(self) -> None:
         """Update month display label with current month/year."""
-        try:
-            month_date = date(self._current_year, self._current_month, 1)
-            month_name = month_date.strftime("%B %Y")
-            self.month_label.setText(month_name)
-        except Exception as e:
-            print(f"Error updating month label: {e}")
-            self.month_label.setText(f"{self._current_month}/{self._current_year}")
+        # _navigate_month keeps the month within 1-12
+        self.month_label.setText(f"{_MONTH_NAMES[self._current_month]} {self._current_year}")
     
     def _load_month_data(self) -> None:
         """
-        Load HP data from database for current month.
+        Load HP data for current month and update the ring chart.
         
-        Queries daily_points table and updates ring chart display.
+        Recently visited months are served from ``self._month_cache``;
+        reloading the month already on display is a no-op.
         Handles HP = 33 as default/uninitialized state.
         """
+        key = (self._current_year, self._current_month)
+        if key == self._shown_month:
+            return
+        
         try:
-            # Calculate days in month
-            if self._current_month == 12:
-                next_month = date(self._current_year + 1, 1, 1)
-            else:
-                next_month = date(self._current_year, self._current_month + 1, 1)
+            cached = self._month_cache.pop(key, None)
+            if cached is None:
+                cached = self._fetch_month(*key)
             
-            first_day = date(self._current_year, self._current_month, 1)
-            last_day = next_month - timedelta(days=1)
-            days_in_month = last_day.day
+            # Re-insert as most recently used, evicting the oldest month
+            self._month_cache[key] = cached
+            if len(self._month_cache) > _MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
             
-            # Query database
-            date_pattern = f"{self._current_year:04d}-{self._current_month:02d}-%"
-            
-            cursor = self._db._connection.cursor()
-            cursor.execute(
-                """
-                SELECT date, hp, physical, mental
-                FROM daily_points
-                WHERE date LIKE ?
-                ORDER BY date ASC
-                """,
-                (date_pattern,)
-            )
-            
-            rows = cursor.fetchall()
-            
-            # Convert to dictionary
-            self._hp_data = {}
-            for row in rows:
-                date_str = row['date']
-                day = int(date_str.split('-')[2])
-                
-                # Store HP data regardless of value (including HP=33 default)
-                self._hp_data[day] = HPData(
-                    hp=row['hp'],
-                    physical=row['physical'],
-                    mental=row['mental'],
-                    date_str=date_str
-                )
+            self._hp_data, days_in_month = cached
             
             # Update ring chart
             self.ring_widget.set_hp_data(self._hp_data, days_in_month)
+            self._shown_month = key
             
             # Clear detail panel
-            self.detail_label.setText("Click on a day to view details")
+            self.detail_label.setText(_DETAIL_PROMPT)
             
-            print(f"Loaded {len(self._hp_data)} HP records for {self._current_year}-{self._current_month:02d}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Loaded %d HP records for %d-%02d",
+                    len(self._hp_data), self._current_year, self._current_month
+                )
         
-        except Exception as e:
-            print(f"Error loading month data: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception(
+                "Error loading month data for %d-%02d", self._current_year, self._current_month
+            )
             
+            self._shown_month = None
             self.detail_label.setText(
                 f"Error loading data for {self._current_year}-{self._current_month:02d}"
             )
     
+    def _fetch_month(self, year: int, month: int) -> Tuple[Dict[int, HPData], int]:
+        """
+        Query daily_points for one month.
+        
+        Args:
+            year: Year to load
+            month: Month to load (1-12)
+            
+        Returns:
+            Tuple of (day number -> HPData, days in month)
+        """
+        # Calculate days in month
+        if month == 12:
+            next_month = date(year + 1, 1, 1)
+        else:
+            next_month = date(year, month + 1, 1)
+        
+        days_in_month = (next_month - timedelta(days=1)).day
+        
+        # Query database
+        month_prefix = f"{year:04d}-{month:02d}"
+        
+        cursor = self._cursor
+        cursor.execute(_MONTH_POINTS_SQL, (f"{month_prefix}-01", f"{month_prefix}-31"))
+        
+        # Store HP data regardless of value (including HP=33 default).
+        # Rows already satisfy the table's CHECK constraints, which mirror
+        # HPData's field bounds, so skip pydantic validation per row
+        hp_data = {
+            row['day']: HPData.model_construct(
+                hp=row['hp'],
+                physical=row['physical'],
+                mental=row['mental'],
+                date_str=row['date']
+            )
+            for row in cursor
+        }
+        
+        return hp_data, days_in_month
+    
+    @pyqtSlot()
+    def _prev_month(self) -> None:
+        """Navigate to the previous month."""
+        self._navigate_month(-1)
+    
+    @pyqtSlot()
+    def _next_month(self) -> None:
+        """Navigate to the next month."""
+        self._navigate_month(1)
+    
     def _navigate_month(self, delta: int) -> None:
         """
         Navigate to previous or next month.
@@ -250,14 +337,12 @@ class MonthlyHPTrackerWindow(QDialog):
                 self._current_month = 12
                 self._current_year -= 1
             
-            # Update display
+            # Update label now, load data once navigation settles
             self._update_month_label()
-            self._load_month_data()
+            self._load_timer.start()
         
-        except Exception as e:
-            print(f"Error navigating month: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error navigating month")
     
     def _on_day_selected(self, day: int) -> None:
         """
@@ -274,42 +359,32 @@ class MonthlyHPTrackerWindow(QDialog):
             
             if hp_data is None:
                 # No database record for this day
-                self.detail_label.setText(
-                    f"Day {day}\n\n"
-                    f"No HP data recorded for this day."
-                )
+                self.detail_label.setText(f"Day {day}\n\nNo HP data recorded for this day.")
                 self.detail_label.setStyleSheet("color: #FF6B6B; font-size: 16px;")
             
             elif hp_data.hp == 20:
                 # HP = 20 indicates default/uninitialized state
                 self.detail_label.setText(
-                    f"Day {day} - {hp_data.date_str}\n\n"
-                    f"HP: 33 (Default - No points entered)\n"
-                    f"Physical: {hp_data.physical} | "
-                    f"Mental: {hp_data.mental} | "
+                    f"Day {day} - {hp_data.date_str}\n\nHP: 33 (Default - No points entered)\n"
+                    f"Physical: {hp_data.physical} | Mental: {hp_data.mental} | "
                 )
                 self.detail_label.setStyleSheet("color: #B0B0B0; font-size: 16px;")
             
             else:
                 # Normal HP data with valid category
-                detail_text = (
-                    f"Day {day} - {hp_data.date_str}\n\n"
-                    f"{hp_data.format_display()}"
+                self.detail_label.setText(
+                    f"Day {day} - {hp_data.date_str}\n\n{hp_data.format_display()}"
                 )
                 
-                self.detail_label.setText(detail_text)
-                
                 # Color code based on HP category
                 color = self._get_detail_color(hp_data.hp)
-                self.detail_label.setStyleSheet(f"color: {color}; font-size: 16px;")
+                self.detail_label.setStyleSheet(_DETAIL_STYLES[color])
             
             # Update ring chart highlight
             self.ring_widget.set_selected_day(day)
         
-        except Exception as e:
-            print(f"Error displaying day details: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error displaying details for day %d", day)
     
     def _get_detail_color(self, hp: int) -> str:
         """
@@ -321,15 +396,4 @@ class MonthlyHPTrackerWindow(QDialog):
         Returns:
             Hex color code for text display
         """
-        if hp <= 20:
-            return '#B0B0B0'  # Light Gray (None/Default)
-        elif 21 <= hp <= 40:
-            return '#FF6B6B'  # Red (Very Low)
-        elif 41 <= hp <= 55:
-            return '#FFBE57'  # Orange (Low)
-        elif 56 <= hp <= 75:
-            return '#B7E6B9'  # Light Green (Moderate)
-        elif 76 <= hp <= 83:
-            return '#68CC6D'  # Green (High)
-        else:  # 84-100
-            return '#1FDE28'  # Bright Green (Maximum)
\ No newline at end of file
+        return _HP_COLORS[bisect_left(_HP_UPPER_BOUNDS, hp)]
\ No newline at end of file
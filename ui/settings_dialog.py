@@ -10,12 +10,23 @@ from PyQt6.QtWidgets import (
     QSlider, QPushButton, QGroupBox, QFormLayout,
     QDialogButtonBox, QSpinBox, QWidget, QApplication  # ← 添加 QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QCoreApplication  # ← 添加 QCoreApplication
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QCoreApplication  # ← 添加 QCoreApplication
 from PyQt6.QtGui import QFont
 
 from utils.settings_manager import SettingsManager
 
 
+# Framed box around the live font preview
+_PREVIEW_QSS = """
+    QLabel {
+        padding: 20px;
+        background-color: #3D3D3D;
+        border: 1px solid #555555;
+        border-radius: 4px;
+    }
+"""
+
+
 class SettingsDialog(QDialog):
     """
     Settings dialog for UI customization.
@@ -45,7 +56,17 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(600)   
         self.setMinimumHeight(500)  
         
+        # Coalesce slider drags / spinbox repeats into one preview update.
+        # (scale_slider.setTracking(False) would also avoid the churn, but
+        # the percentage label would then stop following the drag.)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(40)
+        self._preview_timer.timeout.connect(self._update_preview)
+        
         self._setup_ui()
+        # Preview font is kept and resized in place on each preview update
+        self._preview_font = self.preview_label.font()
         self._load_current_settings()
     
     def _setup_ui(self) -> None:
@@ -71,14 +92,7 @@ class SettingsDialog(QDialog):
         
         # Preview label
         self.preview_label = QLabel("Preview: Sample Text")
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                padding: 20px;
-                background-color: #3D3D3D;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-        """)
+        self.preview_label.setStyleSheet(_PREVIEW_QSS)
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.preview_label)
         
@@ -182,7 +196,7 @@ class SettingsDialog(QDialog):
         """
         scale = value / 100.0
         self.scale_value_label.setText(f"{value}%")
-        self._update_preview()
+        self._preview_timer.start()
     
     def _on_text_size_changed(self, value: int) -> None:
         """
@@ -191,7 +205,7 @@ class SettingsDialog(QDialog):
         Args:
             value: Size offset (-4 to +8)
         """
-        self._update_preview()
+        self._preview_timer.start()
     
     def _update_preview(self) -> None:
         """Update preview label with current settings."""
@@ -203,9 +217,8 @@ class SettingsDialog(QDialog):
         preview_size = int(base_size * scale) + text_offset
         
         # Apply to preview
-        font = self.preview_label.font()
-        font.setPointSize(max(8, preview_size))  # Minimum 8pt
-        self.preview_label.setFont(font)
+        self._preview_font.setPointSize(max(8, preview_size))  # Minimum 8pt
+        self.preview_label.setFont(self._preview_font)
     
     def _reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
@@ -0,0 +1,137 @@
+"""
+Dialog for adding calendar events.
+
+Collects title, date and optional description for a new event. Imported
+lazily by CalendarWidget when the user first opens it, then reused.
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QFormLayout,
+    QLineEdit, QTextEdit, QDateEdit, QDialogButtonBox
+)
+from PyQt6.QtCore import Qt, QDate
+
+_ADD_EVENT_DIALOG_QSS = """
+    QDialog {
+        background-color: #2D2D2D;
+    }
+    QLabel {
+        color: #FFFFFF;
+        font-size: 16px;
+    }
+    QLineEdit, QTextEdit, QDateEdit {
+        background-color: #3D3D3D;
+        color: #FFFFFF;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 5px;
+        font-size: 20px;
+    }
+    QLineEdit:focus, QTextEdit:focus, QDateEdit:focus {
+        border: 1px solid #4ECDC4;
+    }
+    QDateEdit::drop-down {
+        border: none;
+        background-color: #4ECDC4;
+    }
+    QDateEdit::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #FFFFFF;
+        margin-right: 5px;
+    }
+    QPushButton {
+        background-color: #4ECDC4;
+        color: #000000;
+        border: none;
+        padding: 8px 18px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #6FE4DB;
+    }
+"""
+
+
+class AddEventDialog(QDialog):
+    """Dialog for adding new calendar events."""
+    
+    def __init__(self, default_date: str, parent=None):
+        """
+        Initialize add event dialog.
+        
+        Args:
+            default_date: Default date for new event
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Add New Event")
+        self.setModal(True)
+        self.setMinimumWidth(500)
+        self.setMinimumHeight(400)
+        self._setup_ui()
+        self.reset(default_date)
+    
+    def reset(self, default_date: str) -> None:
+        """
+        Clear the form for reuse and set the default date.
+        
+        Args:
+            default_date: Default date for new event (ISO format)
+        """
+        self.title_input.clear()
+        self.description_input.clear()
+        parsed = QDate.fromString(default_date, Qt.DateFormat.ISODate)
+        self.date_input.setDate(parsed if parsed.isValid() else QDate.currentDate())
+        self.title_input.setFocus()
+    
+    def _setup_ui(self) -> None:
+        """Initialize dialog UI."""
+        self.setStyleSheet(_ADD_EVENT_DIALOG_QSS)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        
+        self.title_input = QLineEdit()
+        self.title_input.setPlaceholderText("e.g., Clinic, Reply Emails")
+        form.addRow("Event Title:", self.title_input)
+        
+        self.date_input = QDateEdit()
+        self.date_input.setCalendarPopup(True)
+        form.addRow("Event Date:", self.date_input)
+        
+        self.description_input = QTextEdit()
+        self.description_input.setMaximumHeight(200)
+        form.addRow("Description:", self.description_input)
+        
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | 
+            QDialogButtonBox.StandardButton.Cancel
+        )
+        button_box.accepted.connect(self._validate_and_accept)
+        button_box.rejected.connect(self.reject)
+        
+        layout.addLayout(form)
+        layout.addWidget(button_box)
+    
+    def _validate_and_accept(self) -> None:
+        """Validate input and accept dialog."""
+        if not self.title_input.text().strip():
+            return
+        self.accept()
+    
+    def get_event_data(self) -> dict:
+        """
+        Get entered event data.
+        
+        Returns:
+            Dictionary with title, event_date, description
+        """
+        return {
+            'title': self.title_input.text().strip(),
+            'event_date': self.date_input.date().toString(Qt.DateFormat.ISODate),
+            'description': self.description_input.toPlainText().strip() or None
+        }
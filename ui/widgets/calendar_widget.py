@@ -5,21 +5,35 @@ Displays monthly calendar with highlighted dates containing events and tasks,
 and shows unified event/task list for selected dates.
 """
 
-from typing import List
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QCalendarWidget,
     QListWidget, QListWidgetItem, QLabel,
-    QPushButton, QHBoxLayout, QDialog,
-    QLineEdit, QTextEdit, QDialogButtonBox,
-    QFormLayout, QDateEdit, QMessageBox
+    QPushButton, QHBoxLayout, QDialog, QMessageBox,
+    QStyledItemDelegate, QStyle, QStyleOptionViewItem, QApplication
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal, QSize
-from PyQt6.QtGui import QTextCharFormat, QColor, QFont
+from PyQt6.QtCore import (
+    Qt, QDate, QTimer, pyqtSignal, QSize, QRect, QPoint, QEvent,
+    QModelIndex, QPersistentModelIndex, QAbstractItemModel
+)
+from PyQt6.QtGui import QTextCharFormat, QColor, QFont, QFontMetrics, QPainter
 
 from managers import EventManager, TaskManager
 from models import CalendarEvent, Task
 from utils import get_today
 
+logger = logging.getLogger(__name__)
+
+# Visited months whose highlights are kept for back/forward paging
+_MONTH_CACHE_SIZE = 12
+
+
+def _effective_date(task: Task) -> Optional[str]:
+    """Return the date a task is highlighted on: due_date, else date."""
+    return task.due_date or task.date
+
 
 class CalendarWidget(QWidget):
     """
@@ -31,6 +45,9 @@ class CalendarWidget(QWidget):
     
     date_selected = pyqtSignal(str)  # Emits ISO date
     
+    # Shared date text formats by highlight type, built on first init
+    _FORMATS: Dict[str, QTextCharFormat] = {}
+    
     def __init__(self, event_manager: EventManager, task_manager: TaskManager, parent=None):
         """
         Initialize calendar widget with event and task integration.
@@ -44,12 +61,70 @@ class CalendarWidget(QWidget):
         
         self._event_manager = event_manager
         self._task_manager = task_manager
+        
+        if not CalendarWidget._FORMATS:
+            CalendarWidget._FORMATS = self._build_highlight_formats()
         self._current_year = QDate.currentDate().year()
         self._current_month = QDate.currentDate().month()
         
+        # Last date handled by _on_date_selected
+        self._last_selected_iso = ''
+        
+        # Highlights currently applied to the calendar: ISO date -> type
+        self._current_highlights: Dict[str, str] = {}
+        self._highlighted_month: Optional[str] = None
+        
+        # LRU of highlights per "YYYY-MM", so paging back to a recently
+        # visited month skips the queries; dropped on any data change
+        self._month_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        
+        # AddEventDialog, built on first use and reset for each later one
+        self._add_dialog = None
+        
+        # Set when a reload was requested while hidden; run on next show
+        self._reload_pending = False
+        
+        # The selected-date list depends only on the selection and the
+        # data, so month loads rebuild it only after a data change
+        self._event_list_stale = True
+        
+        # Coalesce bursts of manager signals (bulk edits/imports) into a
+        # single month reload; start() restarts the countdown
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self._load_events)
+        
         self._setup_ui()
         self._connect_signals()
-        self._load_events()
+        # First month load runs from the event loop, after the window
+        # is built and shown, rather than inside the constructor
+        self._reload_timer.start()
+    
+    @staticmethod
+    def _build_highlight_formats() -> Dict[str, QTextCharFormat]:
+        """
+        Build the date text formats used for calendar highlighting.
+        
+        Returns:
+            Formats keyed by 'event', 'task', 'both' and 'default'
+        """
+        formats = {'default': QTextCharFormat()}
+        
+        # Color coding by type: (background, foreground)
+        colors = {
+            'event': ('#4ECDC4', '#000000'),  # Cyan background for events only
+            'task': ('#FFB700', '#000000'),   # Orange background for tasks only
+            'both': ('#9B59B6', '#FFFFFF'),   # Purple background for mixed dates
+        }
+        for highlight_type, (background, foreground) in colors.items():
+            highlight_format = QTextCharFormat()
+            highlight_format.setBackground(QColor(background))
+            highlight_format.setForeground(QColor(foreground))
+            highlight_format.setFontWeight(QFont.Weight.Bold)
+            formats[highlight_type] = highlight_format
+        
+        return formats
     
     def _setup_ui(self) -> None:
         """Initialize UI components and layout."""
@@ -77,6 +152,17 @@ class CalendarWidget(QWidget):
         self.event_list.setMaximumWidth(700)
         self.event_list.setMinimumHeight(400)
         
+        # Rows are painted by a delegate instead of per-row widgets;
+        # mouse tracking lets it draw the delete button hover state
+        self._list_delegate = EventListDelegate(self.event_list)
+        # Queued: deleting reloads the list, which must not happen inside
+        # the delegate's own event handling
+        self._list_delegate.delete_requested.connect(
+            self._on_delete_requested, Qt.ConnectionType.QueuedConnection
+        )
+        self.event_list.setItemDelegate(self._list_delegate)
+        self.event_list.setMouseTracking(True)
+        
         # Add event button
         self.add_event_button = QPushButton("Add Event")
         self.add_event_button.setMaximumWidth(300)
@@ -97,121 +183,146 @@ class CalendarWidget(QWidget):
         self.calendar.currentPageChanged.connect(self._on_month_changed)
         self.add_event_button.clicked.connect(self._on_add_event)
         
-        self._event_manager.data_changed.connect(self._load_events)
-        self._event_manager.event_created.connect(self._on_event_created)
+        # create_event emits data_changed as well as event_created, so
+        # data_changed alone covers new events
+        self._event_manager.data_changed.connect(self._on_data_changed)
         
         # Connect task manager signals
-        self._task_manager.data_changed.connect(self._load_events)
+        self._task_manager.data_changed.connect(self._on_data_changed)
+    
+    def _on_data_changed(self) -> None:
+        """Drop cached month highlights and schedule a reload."""
+        self._month_cache.clear()
+        self._event_list_stale = True
+        self._reload_timer.start()
     
     def _load_events(self) -> None:
         """
         Load events AND tasks for current month and update calendar highlighting.
         
         FIXED: Now considers both task.date and task.due_date fields.
+        Deferred until the widget is next shown when it is hidden.
         """
+        if not self.isVisible():
+            self._reload_pending = True
+            return
+        
         try:
-            print(f"\n=== Loading calendar for {self._current_year}-{self._current_month:02d} ===")
-            
             # Fetch events
             events = self._event_manager.get_events_for_month(
                 self._current_year,
                 self._current_month
             )
-            print(f"Events found: {len(events)}")
-            for event in events:
-                print(f"  Event: {event.title} on {event.event_date}")
-            
-            # ==================== FIXED: TASK RETRIEVAL ====================
-            # Get ALL tasks and filter by EITHER date field or due_date field
-            all_tasks = self._task_manager.get_all_tasks()
             
-            tasks_this_month = []
-            for task in all_tasks:
-                matched = False
-                
-                # Check due_date first (higher priority)
-                if task.due_date:
-                    try:
-                        y, m, _ = map(int, task.due_date.split('-'))
-                        if y == self._current_year and m == self._current_month:
-                            tasks_this_month.append(task)
-                            matched = True
-                            print(f"  Task (due_date): {task.title} on {task.due_date}")
-                    except Exception as e:
-                        print(f"  Error parsing task due_date: {e}")
-                
-                # Fallback to date field if not already matched
-                if not matched and task.date:
-                    try:
-                        y, m, _ = map(int, task.date.split('-'))
-                        if y == self._current_year and m == self._current_month:
-                            tasks_this_month.append(task)
-                            print(f"  Task (date): {task.title} on {task.date}")
-                    except Exception as e:
-                        print(f"  Error parsing task date: {e}")
-            
-            print(f"Tasks in this month: {len(tasks_this_month)}")
-            # ================================================================
-            
-            # Clear existing highlights
-            self._clear_highlights()
-            
-            # Get unique event dates
-            event_dates = set(event.event_date for event in events)
+            # Tasks whose due_date or date falls in this month
+            tasks_this_month = self._task_manager.get_calendar_tasks_for_month(
+                self._current_year,
+                self._current_month
+            )
             
-            # ==================== FIXED: TASK DATE EXTRACTION ====================
-            # Get unique task display dates (prioritize due_date over date)
-            task_dates = set()
+            # Target highlight per date for this month, in one pass over
+            # events then tasks: a task on an event date upgrades it to 'both'.
+            # A task can match this month by one field while its display
+            # date lies in another month; dates are canonical YYYY-MM-DD,
+            # so a prefix test keeps only this month's
+            month_prefix = f"{self._current_year:04d}-{self._current_month:02d}-"
+            new_highlights: Dict[str, str] = {event.event_date: 'event' for event in events}
             for task in tasks_this_month:
-                display_date = task.due_date if task.due_date else task.date
-                if display_date:
-                    task_dates.add(display_date)
-            # =====================================================================
-            
-            print(f"Unique event dates: {event_dates}")
-            print(f"Unique task dates: {task_dates}")
-            
-            # Highlight dates based on content type
-            dates_with_both = event_dates & task_dates
-            dates_with_only_events = event_dates - task_dates
-            dates_with_only_tasks = task_dates - event_dates
-            
-            print(f"Dates with events only: {dates_with_only_events}")
-            print(f"Dates with tasks only: {dates_with_only_tasks}")
-            print(f"Dates with both: {dates_with_both}")
-            
-            # Apply highlighting with visual distinction
-            for date_str in dates_with_only_events:
-                self._highlight_date(date_str, highlight_type='event')
-            
-            for date_str in dates_with_only_tasks:
-                self._highlight_date(date_str, highlight_type='task')
+                display_date = _effective_date(task)
+                if display_date and display_date.startswith(month_prefix):
+                    if new_highlights.get(display_date, 'task') == 'task':
+                        new_highlights[display_date] = 'task'
+                    else:
+                        new_highlights[display_date] = 'both'
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Calendar %d-%02d: %d events, %d tasks; highlights %s",
+                    self._current_year, self._current_month,
+                    len(events), len(tasks_this_month),
+                    sorted(new_highlights.items())
+                )
             
-            for date_str in dates_with_both:
-                self._highlight_date(date_str, highlight_type='both')
+            month_key = month_prefix[:-1]
             
-            # Refresh event list for currently selected date
-            self._update_event_list()
+            self._month_cache[month_key] = new_highlights
+            if len(self._month_cache) > _MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
+            self._apply_highlights(month_key, new_highlights)
             
-            print("=== Calendar loading complete ===\n")
+            # Selection changes refresh the list themselves; only stale
+            # data needs it here
+            if self._event_list_stale:
+                self._update_event_list()
             
-        except Exception as e:
-            print(f"ERROR loading events and tasks: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception(
+                "Error loading events and tasks for %d-%02d",
+                self._current_year, self._current_month
+            )
+    
+    def showEvent(self, event) -> None:
+        """
+        Run a reload that was requested while the widget was hidden.
+        
+        Args:
+            event: QShowEvent
+        """
+        super().showEvent(event)
+        if self._reload_pending:
+            self._reload_pending = False
+            self._reload_timer.start()
+    
+    def _apply_highlights(self, month_key: str, new_highlights: Dict[str, str]) -> None:
+        """
+        Apply a month's highlights, touching only dates that changed.
+        
+        Args:
+            month_key: Month as "YYYY-MM"
+            new_highlights: Target highlight type per ISO date
+        """
+        # Nothing to do on a reload that changed nothing, e.g. an empty month
+        if month_key == self._highlighted_month and new_highlights == self._current_highlights:
+            return
+        
+        # One batch: no repaint or selection signal per setDateTextFormat call
+        self.calendar.setUpdatesEnabled(False)
+        self.calendar.blockSignals(True)
+        try:
+            # A different month shares no dates with the previous one
+            if month_key != self._highlighted_month:
+                self._clear_highlights()
+                self._highlighted_month = month_key
+            
+            for date_str in self._current_highlights.keys() - new_highlights.keys():
+                self._unhighlight_date(date_str)
+            
+            for date_str, highlight_type in new_highlights.items():
+                if self._current_highlights.get(date_str) != highlight_type:
+                    self._highlight_date(date_str, highlight_type=highlight_type)
+            
+            self._current_highlights = dict(new_highlights)
+        finally:
+            self.calendar.blockSignals(False)
+            self.calendar.setUpdatesEnabled(True)
+            self.calendar.update()
     
     def _clear_highlights(self) -> None:
-        """Clear all calendar date highlights."""
-        default_format = QTextCharFormat()
-        year = self.calendar.yearShown()
-        month = self.calendar.monthShown()
-        for day in range(1, 32):
-            try:
-                date = QDate(year, month, day)
-                if date.isValid():
-                    self.calendar.setDateTextFormat(date, default_format)
-            except:
-                break
+        """Clear every calendar date highlight applied so far."""
+        for date_str in self._current_highlights:
+            self._unhighlight_date(date_str)
+        self._current_highlights = {}
+    
+    def _unhighlight_date(self, date_str: str) -> None:
+        """
+        Reset a calendar date to the default text format.
+        
+        Args:
+            date_str: Date in ISO format (YYYY-MM-DD)
+        """
+        qdate = QDate.fromString(date_str, Qt.DateFormat.ISODate)
+        if qdate.isValid():
+            self.calendar.setDateTextFormat(qdate, self._FORMATS['default'])
     
     def _highlight_date(self, date_str: str, highlight_type: str = 'event') -> None:
         """
@@ -221,45 +332,41 @@ class CalendarWidget(QWidget):
             date_str: Date in ISO format (YYYY-MM-DD)
             highlight_type: Type of highlight ('event', 'task', 'both')
         """
-        try:
-            year, month, day = map(int, date_str.split('-'))
-            date = QDate(year, month, day)
-            if not date.isValid():
-                return
-            
-            highlight_format = QTextCharFormat()
-            
-            # Color coding by type
-            if highlight_type == 'event':
-                # Cyan background for events only
-                highlight_format.setBackground(QColor('#4ECDC4'))
-                highlight_format.setForeground(QColor('#000000'))
-            elif highlight_type == 'task':
-                # Orange background for tasks only
-                highlight_format.setBackground(QColor("#FFB700"))
-                highlight_format.setForeground(QColor('#000000'))
-            elif highlight_type == 'both':
-                # Purple background for mixed dates
-                highlight_format.setBackground(QColor('#9B59B6'))
-                highlight_format.setForeground(QColor('#FFFFFF'))
-            
-            highlight_format.setFontWeight(QFont.Weight.Bold)
-            self.calendar.setDateTextFormat(date, highlight_format)
-            
-            print(f"Highlighted {date_str} as {highlight_type}")
-            
-        except Exception as e:
-            print(f"ERROR highlighting date {date_str}: {e}")
+        qdate = QDate.fromString(date_str, Qt.DateFormat.ISODate)
+        if qdate.isValid():
+            self.calendar.setDateTextFormat(qdate, self._FORMATS[highlight_type])
     
     def _on_date_selected(self) -> None:
         """Handle calendar date selection."""
+        # selectionChanged also fires for programmatic reselects of the
+        # same date (e.g. after a page change); nothing to rebuild then
+        date_str = self.calendar.selectedDate().toString(Qt.DateFormat.ISODate)
+        if date_str == self._last_selected_iso:
+            return
+        self._last_selected_iso = date_str
+        
         self._update_event_list()
-        self.date_selected.emit(self.calendar.selectedDate().toString(Qt.DateFormat.ISODate))
+        self.date_selected.emit(date_str)
     
     def _on_month_changed(self, year: int, month: int) -> None:
         """Handle calendar month change."""
+        if year == self._current_year and month == self._current_month:
+            return
         self._current_year, self._current_month = year, month
-        self._load_events()
+        
+        month_key = f"{year:04d}-{month:02d}"
+        cached = self._month_cache.get(month_key)
+        if cached is None:
+            # Rapid paging restarts the countdown, so only the month the
+            # user stops on is queried
+            self._reload_timer.start()
+            return
+        
+        # A pending reload was for a month paged past; data changes clear
+        # the cache, so it cannot be carrying fresh data for this one
+        self._reload_timer.stop()
+        self._month_cache.move_to_end(month_key)
+        self._apply_highlights(month_key, cached)
     
     def _update_event_list(self) -> None:
         """
@@ -267,203 +374,98 @@ class CalendarWidget(QWidget):
         
         FIXED: Now matches tasks by EITHER date or due_date field.
         """
+        self._event_list_stale = False
         try:
             selected_date = self.calendar.selectedDate()
             date_str = selected_date.toString(Qt.DateFormat.ISODate)
             
-            print(f"\n=== Updating event list for {date_str} ===")
-            
             # Fetch events
             events = self._event_manager.get_events_for_date(date_str)
-            print(f"Events found: {len(events)}")
-            for event in events:
-                print(f"  Event: {event.title}")
-            
-            # ==================== FIXED: TASK MATCHING ====================
-            # Get ALL tasks and filter by EITHER date or due_date
-            all_tasks = self._task_manager.get_all_tasks()
-            print(f"Total tasks in database: {len(all_tasks)}")
-            
-            tasks_for_date = []
-            for task in all_tasks:
-                matched = False
-                match_reason = ""
-                
-                # Priority 1: Match by due_date
-                if task.due_date == date_str:
-                    tasks_for_date.append(task)
-                    matched = True
-                    match_reason = "due_date"
-                
-                # Priority 2: Match by date field (only if due_date didn't match)
-                elif not matched and task.date == date_str:
-                    tasks_for_date.append(task)
-                    matched = True
-                    match_reason = "date"
-                
-                if matched:
-                    print(f"  Task '{task.title}': matched by {match_reason} = {date_str}")
-            
-            print(f"Tasks for {date_str}: {len(tasks_for_date)}")
-            # ==============================================================
-            
-            self.event_list.clear()
-            
-            # Check if there's any content to display
-            if not events and not tasks_for_date:
-                empty_item = QListWidgetItem("No events or tasks for this date")
-                self.event_list.addItem(empty_item)
-                print("No events or tasks to display")
-                return
             
-            # Display events first
-            for event in events:
-                print(f"Adding event to list: {event.title}")
-                self._add_event_item(event)
+            # Tasks whose due_date or date is the selected date
+            tasks_for_date = self._task_manager.get_calendar_tasks_for_date(date_str)
             
-            # Display tasks
-            if tasks_for_date:
-                # Sort by priority (high to low) then alphabetically
-                sorted_tasks = sorted(
-                    tasks_for_date,
-                    key=lambda t: (-t.priority, t.title)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Event list for %s: %d events, %d tasks",
+                    date_str, len(events), len(tasks_for_date)
                 )
-                
-                for task in sorted_tasks:
-                    print(f"Adding task to list: {task.title}")
-                    self._add_task_item(task)
             
-            print("=== Event list update complete ===\n")
+            # Events first, then tasks (already ordered by priority, title)
+            rows: List[object] = [*events, *tasks_for_date]
             
-        except Exception as e:
-            print(f"ERROR updating event list: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def _add_event_item(self, event: CalendarEvent) -> None:
-        """Add event item with delete button to list."""
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-        item_layout.setContentsMargins(5, 5, 5, 5)
-        
-        event_text_layout = QVBoxLayout()
-        title_label = QLabel(f"📅 {event.title}")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(14)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: white;")
-        event_text_layout.addWidget(title_label)
-        
-        if event.description:
-            desc_label = QLabel(f"  {event.description}")
-            desc_label.setStyleSheet("color: #AAAAAA; font-size: 16px;")
-            desc_label.setWordWrap(True)
-            event_text_layout.addWidget(desc_label)
-        
-        delete_button = QPushButton("X")
-        delete_button.setFixedSize(35, 35)
-        delete_button.setStyleSheet("""
-            QPushButton {
-                font-size: 18px; background-color: #F44336; color: white;
-                border: none; border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #D32F2F; }
-        """)
-        delete_button.clicked.connect(lambda: self._on_delete_event(event.id, event.title))
-        
-        item_layout.addLayout(event_text_layout)
-        item_layout.addStretch()
-        item_layout.addWidget(delete_button)
+            # Update the list with one repaint at the end
+            self.event_list.setUpdatesEnabled(False)
+            self.event_list.blockSignals(True)
+            try:
+                if not rows:
+                    self.event_list.clear()
+                    self.event_list.addItem(
+                        QListWidgetItem("No events or tasks for this date")
+                    )
+                    return
+                
+                # The placeholder row carries no item data; drop it first
+                first = self.event_list.item(0)
+                if first is not None and first.data(Qt.ItemDataRole.UserRole) is None:
+                    self.event_list.clear()
+                
+                # Rebind existing rows in place (the delegate paints from
+                # UserRole) and only add or remove the difference
+                for row, row_data in enumerate(rows):
+                    item = self.event_list.item(row)
+                    if item is None:
+                        self._add_list_item(row_data)
+                    else:
+                        item.setData(Qt.ItemDataRole.UserRole, row_data)
+                
+                while self.event_list.count() > len(rows):
+                    self.event_list.takeItem(self.event_list.count() - 1)
+            finally:
+                self.event_list.blockSignals(False)
+                self.event_list.setUpdatesEnabled(True)
+            
+        except Exception:
+            logger.exception("Error updating event list")
+    
+    def _add_list_item(self, row_data) -> None:
+        """
+        Append an event or task row; EventListDelegate paints it.
         
+        Args:
+            row_data: CalendarEvent or Task model to display
+        """
         list_item = QListWidgetItem()
-        list_item.setSizeHint(QSize(0, 60))
+        list_item.setData(Qt.ItemDataRole.UserRole, row_data)
         self.event_list.addItem(list_item)
-        self.event_list.setItemWidget(list_item, item_widget)
     
-    def _add_task_item(self, task: Task) -> None:
+    def _on_delete_requested(self, item) -> None:
         """
-        Add task item to event list with visual distinction.
+        Handle delete button click on an event or task row.
         
         Args:
-            task: Task model to display
+            item: CalendarEvent or Task carried by the clicked row
         """
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-        item_layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Task icon and text layout
-        task_text_layout = QVBoxLayout()
-        
-        # Task title with completion indicator and priority badge
-        completion_icon = "✓" if task.is_completed else "○"
-        priority_badge = ""
-        if task.priority == 2:
-            priority_badge = "🔴 "  # High priority
-        elif task.priority == 1:
-            priority_badge = "🟡 "  # Medium priority
-        
-        # Format: 任務名稱(類別) or just 任務名稱 if no category
-        if task.category:
-            display_text = f"{completion_icon} {priority_badge}{task.title}({task.category})"
+        if isinstance(item, CalendarEvent):
+            self._on_delete_event(item.id, item.title)
         else:
-            display_text = f"{completion_icon} {priority_badge}{task.title}"
-        
-        title_label = QLabel(display_text)
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(16)
-        title_label.setFont(title_font)
-        
-        # Strikethrough if completed
-        if task.is_completed:
-            title_label.setStyleSheet("color: #888888; text-decoration: line-through;")
-        else:
-            title_label.setStyleSheet("color: #FFE153;")  # Orange for pending tasks
-        
-        task_text_layout.addWidget(title_label)
-        
-        # Delete button for tasks
-        delete_button = QPushButton("X")
-        delete_button.setFixedSize(35, 35)
-        delete_button.setStyleSheet("""
-            QPushButton {
-                font-size: 18px; background-color: #F44336; color: white;
-                border: none; border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #D32F2F; }
-        """)
-        delete_button.clicked.connect(
-            lambda: self._on_delete_task(task.id, task.title)
-        )
-        
-        item_layout.addLayout(task_text_layout)
-        item_layout.addStretch()
-        item_layout.addWidget(delete_button)
-        
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(QSize(0, 60))
-        self.event_list.addItem(list_item)
-        self.event_list.setItemWidget(list_item, item_widget)
+            self._on_delete_task(item.id, item.title)
     
     def _on_add_event(self) -> None:
         """Handle add event button click."""
         selected_date = self.calendar.selectedDate()
         date_str = selected_date.toString(Qt.DateFormat.ISODate)
-        dialog = AddEventDialog(date_str, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_event_data()
+        if self._add_dialog is None:
+            # Only needed when the user adds an event; keep it off the import path
+            from .add_event_dialog import AddEventDialog
+            self._add_dialog = AddEventDialog(date_str, self)
+        else:
+            self._add_dialog.reset(date_str)
+        
+        if self._add_dialog.exec() == QDialog.DialogCode.Accepted:
+            data = self._add_dialog.get_event_data()
             self._event_manager.create_event(**data)
     
-    def _on_event_created(self, date_str: str) -> None:
-        """Handle event creation signal."""
-        try:
-            year, month, _ = map(int, date_str.split('-'))
-            if year == self._current_year and month == self._current_month:
-                self._load_events()
-        except:
-            pass
-    
     def _on_delete_event(self, event_id: int, event_title: str) -> None:
         """Handle event deletion with confirmation."""
         reply = QMessageBox.question(
@@ -482,9 +484,8 @@ class CalendarWidget(QWidget):
             else:
                 QMessageBox.warning(self, "Deletion Failed", "The event may have already been deleted.")
         except Exception as e:
+            logger.exception("Error deleting event %r", event_title)
             QMessageBox.critical(self, "Error", str(e))
-            import traceback
-            traceback.print_exc()
     
     def _on_delete_task(self, task_id: int, task_title: str) -> None:
         """
@@ -506,127 +507,232 @@ class CalendarWidget(QWidget):
         
         try:
             if self._task_manager.delete_task(task_id):
+                # data_changed schedules the calendar reload
                 QMessageBox.information(self, "Task Deleted", f"Task '{task_title}' deleted.")
-                # Refresh calendar to update highlighting
-                self._load_events()
             else:
                 QMessageBox.warning(self, "Deletion Failed", "The task may have already been deleted.")
         except Exception as e:
+            logger.exception("Error deleting task %r", task_title)
             QMessageBox.critical(self, "Error", str(e))
-            import traceback
-            traceback.print_exc()
 
 
-class AddEventDialog(QDialog):
-    """Dialog for adding new calendar events."""
+class EventListDelegate(QStyledItemDelegate):
+    """
+    Item delegate painting calendar event/task rows with a delete button.
+    
+    Rows carry their CalendarEvent or Task in Qt.ItemDataRole.UserRole;
+    rows without one (the "no events" placeholder) are painted normally.
+    
+    Signals:
+        delete_requested: Emitted with the row's CalendarEvent or Task
+            when its delete button is clicked
+    """
+    
+    delete_requested = pyqtSignal(object)
+    
+    ROW_HEIGHT = 60
+    BUTTON_SIZE = 35
+    MARGIN = 5
     
-    def __init__(self, default_date: str, parent=None):
+    def __init__(self, parent=None):
         """
-        Initialize add event dialog.
+        Initialize delegate and the fonts/colors shared by all rows.
         
         Args:
-            default_date: Default date for new event
             parent: Parent widget
         """
         super().__init__(parent)
-        self._default_date = default_date
-        self.setWindowTitle("Add New Event")
-        self.setModal(True)
-        self.setMinimumWidth(500)
-        self.setMinimumHeight(400)
-        self._setup_ui()
+        
+        self._event_title_font = QFont()
+        self._event_title_font.setBold(True)
+        self._event_title_font.setPointSize(14)
+        
+        self._task_title_font = QFont()
+        self._task_title_font.setBold(True)
+        self._task_title_font.setPointSize(16)
+        
+        self._done_task_title_font = QFont(self._task_title_font)
+        self._done_task_title_font.setStrikeOut(True)
+        
+        self._description_font = QFont()
+        self._description_font.setPixelSize(16)
+        
+        self._button_font = QFont()
+        self._button_font.setPixelSize(18)
+        
+        self._event_color = QColor('#FFFFFF')
+        self._description_color = QColor('#AAAAAA')
+        self._pending_task_color = QColor('#FFE153')
+        self._done_task_color = QColor('#888888')
+        self._button_color = QColor('#F44336')
+        self._button_hover_color = QColor('#D32F2F')
+        
+        # Row whose delete button is under the mouse, tracked from MouseMove
+        self._hover_index = QPersistentModelIndex()
     
-    def _setup_ui(self) -> None:
-        """Initialize dialog UI."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2D2D2D;
-            }
-            QLabel {
-                color: #FFFFFF;
-                font-size: 16px;
-            }
-            QLineEdit, QTextEdit, QDateEdit {
-                background-color: #3D3D3D;
-                color: #FFFFFF;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 5px;
-                font-size: 20px;
-            }
-            QLineEdit:focus, QTextEdit:focus, QDateEdit:focus {
-                border: 1px solid #4ECDC4;
-            }
-            QDateEdit::drop-down {
-                border: none;
-                background-color: #4ECDC4;
-            }
-            QDateEdit::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #FFFFFF;
-                margin-right: 5px;
-            }
-            QPushButton {
-                background-color: #4ECDC4;
-                color: #000000;
-                border: none;
-                padding: 8px 18px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #6FE4DB;
-            }
-        """)
-
-        layout = QVBoxLayout(self)
-        form = QFormLayout()
+    def _button_rect(self, row_rect: QRect) -> QRect:
+        """
+        Compute the delete button rectangle for a row.
+        
+        Args:
+            row_rect: Row rectangle in viewport coordinates
+            
+        Returns:
+            Button rectangle, right-aligned and vertically centered
+        """
+        return QRect(
+            row_rect.right() - self.MARGIN - self.BUTTON_SIZE + 1,
+            row_rect.center().y() - self.BUTTON_SIZE // 2,
+            self.BUTTON_SIZE,
+            self.BUTTON_SIZE
+        )
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return fixed row height for event/task rows."""
+        if index.data(Qt.ItemDataRole.UserRole) is None:
+            return super().sizeHint(option, index)
+        return QSize(0, self.ROW_HEIGHT)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint title, optional description and delete button for a row."""
+        item = index.data(Qt.ItemDataRole.UserRole)
+        if item is None:
+            super().paint(painter, option, index)
+            return
         
-        self.title_input = QLineEdit()
-        self.title_input.setPlaceholderText("e.g., Clinic, Reply Emails")
-        form.addRow("Event Title:", self.title_input)
+        # Row background (hover/selection) from the current style
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
         
-        self.date_input = QDateEdit()
-        self.date_input.setCalendarPopup(True)
-        try:
-            y, m, d = map(int, self._default_date.split('-'))
-            self.date_input.setDate(QDate(y, m, d))
-        except:
-            self.date_input.setDate(QDate.currentDate())
-        form.addRow("Event Date:", self.date_input)
-        
-        self.description_input = QTextEdit()
-        self.description_input.setMaximumHeight(200)
-        form.addRow("Description:", self.description_input)
-        
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | 
-            QDialogButtonBox.StandardButton.Cancel
+        if isinstance(item, CalendarEvent):
+            title = f"📅 {item.title}"
+            title_font = self._event_title_font
+            title_color = self._event_color
+            description = f"  {item.description}" if item.description else None
+        else:
+            # Task title with completion indicator and priority badge
+            completion_icon = "✓" if item.is_completed else "○"
+            priority_badge = ""
+            if item.priority == 2:
+                priority_badge = "🔴 "  # High priority
+            elif item.priority == 1:
+                priority_badge = "🟡 "  # Medium priority
+            
+            # Format: 任務名稱(類別) or just 任務名稱 if no category
+            title = f"{completion_icon} {priority_badge}{item.title}"
+            if item.category:
+                title += f"({item.category})"
+            
+            # Strikethrough if completed, orange for pending tasks
+            if item.is_completed:
+                title_font = self._done_task_title_font
+                title_color = self._done_task_color
+            else:
+                title_font = self._task_title_font
+                title_color = self._pending_task_color
+            description = None
+        
+        row_rect = option.rect
+        button_rect = self._button_rect(row_rect)
+        text_rect = QRect(
+            row_rect.left() + self.MARGIN,
+            row_rect.top() + self.MARGIN,
+            button_rect.left() - row_rect.left() - 2 * self.MARGIN,
+            row_rect.height() - 2 * self.MARGIN
+        )
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Title, with the description (events only) underneath
+        if description:
+            title_rect, description_rect = QRect(text_rect), QRect(text_rect)
+            title_rect.setHeight(text_rect.height() // 2)
+            description_rect.setTop(title_rect.bottom() + 1)
+        else:
+            title_rect, description_rect = text_rect, None
+        
+        painter.setFont(title_font)
+        painter.setPen(title_color)
+        painter.drawText(
+            title_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(title_font).elidedText(
+                title, Qt.TextElideMode.ElideRight, title_rect.width()
+            )
         )
-        button_box.accepted.connect(self._validate_and_accept)
-        button_box.rejected.connect(self.reject)
         
-        layout.addLayout(form)
-        layout.addWidget(button_box)
+        if description_rect is not None:
+            painter.setFont(self._description_font)
+            painter.setPen(self._description_color)
+            painter.drawText(
+                description_rect,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                QFontMetrics(self._description_font).elidedText(
+                    description, Qt.TextElideMode.ElideRight, description_rect.width()
+                )
+            )
+        
+        # Delete button
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver) and self._hover_index == index
+        
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._button_hover_color if hovered else self._button_color)
+        painter.drawRoundedRect(button_rect, 4, 4)
+        
+        painter.setFont(self._button_font)
+        painter.setPen(self._event_color)
+        painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, "X")
+        
+        painter.restore()
     
-    def _validate_and_accept(self) -> None:
-        """Validate input and accept dialog."""
-        if not self.title_input.text().strip():
-            return
-        self.accept()
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> bool:
+        """Track delete button hover and emit delete_requested for left clicks on it."""
+        if event.type() == QEvent.Type.MouseMove:
+            self._update_hover(event.position().toPoint(), option, index)
+        elif (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and self._button_rect(option.rect).contains(event.position().toPoint())
+        ):
+            item = index.data(Qt.ItemDataRole.UserRole)
+            if item is not None:
+                self.delete_requested.emit(item)
+                return True
+        return super().editorEvent(event, model, option, index)
     
-    def get_event_data(self) -> dict:
+    def _update_hover(
+        self,
+        pos: QPoint,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> None:
         """
-        Get entered event data.
+        Record whether the delete button is under the mouse and repaint on change.
         
-        Returns:
-            Dictionary with title, event_date, description
+        The view already repaints rows as the mouse enters or leaves them;
+        this covers moves onto and off the button inside one row.
+        
+        Args:
+            pos: Mouse position in viewport coordinates
+            option: Style option holding the row rectangle
+            index: Row under the mouse
         """
-        return {
-            'title': self.title_input.text().strip(),
-            'event_date': self.date_input.date().toString(Qt.DateFormat.ISODate),
-            'description': self.description_input.toPlainText().strip() or None
-        }
+        over_button = (
+            index.data(Qt.ItemDataRole.UserRole) is not None
+            and self._button_rect(option.rect).contains(pos)
+        )
+        hover_index = QPersistentModelIndex(index) if over_button else QPersistentModelIndex()
+        if hover_index == self._hover_index:
+            return
+        
+        self._hover_index = hover_index
+        if option.widget is not None:
+            option.widget.viewport().update(option.rect)
@@ -5,20 +5,24 @@ Displays daily exercises with checkboxes, progress bars showing
 actual/target ratios, and summary statistics.
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QListWidget, QListWidgetItem,
-    QCheckBox, QDialog, QLineEdit, QDialogButtonBox,
-    QFormLayout, QSpinBox, QComboBox, QTextEdit, QMessageBox
+    QDialog, QLineEdit, QDialogButtonBox,
+    QFormLayout, QSpinBox, QComboBox, QTextEdit, QMessageBox,
+    QStyledItemDelegate, QStyle, QStyleOptionViewItem, QApplication,
+    QAbstractItemView, QToolTip
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    Qt, QSize, QRect, QPoint, QEvent, QModelIndex, QPersistentModelIndex,
+    QAbstractItemModel, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPen, QFontMetrics, QPainter, QHelpEvent
 
 from models import Exercise, ExerciseLog
 from managers import ExerciseManager
 from utils import get_today
-from .exercise_progress_bar import ExerciseProgressBar
 
 
 class ExerciseChecklistWidget(QWidget):
@@ -47,6 +51,9 @@ class ExerciseChecklistWidget(QWidget):
         self._exercise_manager = exercise_manager
         self._current_date = get_today()
         
+        # Exercises shown in the list by id, refreshed on every load
+        self._exercise_cache: Dict[int, Exercise] = {}
+        
         self._setup_ui()
         self._connect_signals()
         self._load_exercises()
@@ -68,10 +75,24 @@ class ExerciseChecklistWidget(QWidget):
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         
-        # Exercise list
+        # Exercise list; rows are painted by a delegate instead of per-row
+        # widgets. Its signals are queued so dialogs and the list refresh
+        # they trigger run outside the delegate's own event handling
         self.list_widget = QListWidget()
-        self.list_widget.setSpacing(8)
+        self.list_widget.setUniformItemSizes(True)
         self.list_widget.setMinimumHeight(250)
+        self._list_delegate = ExerciseItemDelegate(self.list_widget)
+        self._list_delegate.toggle_requested.connect(
+            self._on_toggle_requested, Qt.ConnectionType.QueuedConnection
+        )
+        self._list_delegate.edit_requested.connect(
+            self._on_edit_requested, Qt.ConnectionType.QueuedConnection
+        )
+        self._list_delegate.delete_requested.connect(
+            self._on_delete_requested, Qt.ConnectionType.QueuedConnection
+        )
+        self.list_widget.setItemDelegate(self._list_delegate)
+        self.list_widget.setMouseTracking(True)
         
         # Summary footer (increase font size to 6pt)
         self.summary_label = QLabel()
@@ -123,29 +144,39 @@ class ExerciseChecklistWidget(QWidget):
     def _load_exercises(self) -> None:
         """Load and display exercises for current date."""
         try:
-            # Clear existing items
-            self.list_widget.clear()
-            
             # Get exercises with logs
             exercises_data = self._exercise_manager.get_logs_for_date(self._current_date)
+            self._exercise_cache = {exercise.id: exercise for exercise, _ in exercises_data}
             
             if not exercises_data:
                 # Show empty state
+                self.list_widget.clear()
                 empty_item = QListWidgetItem("No exercises found. Click 'Add Exercise' to get started.")
                 self.list_widget.addItem(empty_item)
                 self._update_summary([], [])
                 return
             
-            # Add each exercise as list item
-            exercises = []
-            logs = []
+            # The empty-state row carries no item data; drop it first
+            first = self.list_widget.item(0)
+            if first is not None and first.data(Qt.ItemDataRole.UserRole) is None:
+                self.list_widget.clear()
+            
+            # Update rows in place: only rows whose exercise or log changed
+            # are rebound (and repainted); rows are added or removed only
+            # when the number of exercises changes
+            for row, (exercise, log) in enumerate(exercises_data):
+                item = self.list_widget.item(row)
+                if item is None:
+                    self._add_exercise_item(exercise, log)
+                elif item.data(Qt.ItemDataRole.UserRole) != (exercise, log):
+                    item.setData(Qt.ItemDataRole.UserRole, (exercise, log))
             
-            for exercise, log in exercises_data:
-                exercises.append(exercise)
-                logs.append(log)
-                self._add_exercise_item(exercise, log)
+            while self.list_widget.count() > len(exercises_data):
+                self.list_widget.takeItem(self.list_widget.count() - 1)
             
             # Update summary
+            exercises = [exercise for exercise, _ in exercises_data]
+            logs = [log for _, log in exercises_data]
             self._update_summary(exercises, logs)
             
         except Exception as e:
@@ -155,100 +186,46 @@ class ExerciseChecklistWidget(QWidget):
     
     def _add_exercise_item(self, exercise: Exercise, log: ExerciseLog) -> None:
         """
-        Add exercise with progress bar to list.
+        Add exercise row to list; ExerciseItemDelegate paints it.
         
         Args:
             exercise: Exercise definition
             log: Current log data
         """
-        # Create container widget
-        item_widget = QWidget()
-        item_layout = QVBoxLayout(item_widget)
-        item_layout.setContentsMargins(5, 5, 5, 5)
-        item_layout.setSpacing(5)
-        
-        # Row 1: Checkbox + Name + Edit button + Delete button
-        top_row = QHBoxLayout()
-        
-        checkbox = QCheckBox(exercise.name)
-        checkbox.setChecked(log.completed)
-        # White checkbox styling, 16pt font
-        checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: white;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid white;
-                border-radius: 3px;
-                background-color: transparent;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #32CD32;
-                border: 2px solid white;
-            }
-        """)
-        
-        # Store exercise_id and log in checkbox for later reference
-        checkbox.setProperty("exercise_id", exercise.id)
-        checkbox.setProperty("log", log)
-        
-        checkbox.stateChanged.connect(
-            lambda state, eid=exercise.id: self._on_checkbox_changed(eid, state)
-        )
-        
-        top_row.addWidget(checkbox)
-        top_row.addStretch()
-        
-        # Edit button (three dots)
-        edit_button = QPushButton("⋯")
-        edit_button.setMaximumWidth(40)
-        edit_button.setMinimumHeight(30)
-        edit_button.setStyleSheet("font-size: 20px; font-weight: bold;")
-        edit_button.setToolTip("Edit progress")
-        edit_button.clicked.connect(
-            lambda checked, eid=exercise.id, lg=log: self._on_edit_progress(eid, lg)
-        )
-        
-        # Delete button (trash icon)
-        delete_button = QPushButton("X")
-        delete_button.setMaximumWidth(40)
-        delete_button.setMinimumHeight(30)
-        delete_button.setStyleSheet("""
-            QPushButton {
-                font-size: 18px;
-                background-color: #F44336;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #D32F2F;
-            }
-        """)
-        delete_button.setToolTip("Delete exercise")
-        delete_button.clicked.connect(
-            lambda checked, eid=exercise.id, name=exercise.name: self._on_delete_exercise(eid, name)
-        )
-        
-        top_row.addWidget(edit_button)
-        top_row.addWidget(delete_button)
+        list_item = QListWidgetItem()
+        list_item.setData(Qt.ItemDataRole.UserRole, (exercise, log))
+        self.list_widget.addItem(list_item)
+    
+    def _on_toggle_requested(self, row) -> None:
+        """
+        Handle a click on a row's checkbox or name.
         
-        # Row 2: Progress bar
-        progress_bar = ExerciseProgressBar(log, exercise.color)
+        Args:
+            row: (Exercise, ExerciseLog) carried by the clicked row
+        """
+        exercise, log = row
+        new_state = Qt.CheckState.Unchecked if log.completed else Qt.CheckState.Checked
+        self._on_checkbox_changed(exercise.id, new_state.value)
+    
+    def _on_edit_requested(self, row) -> None:
+        """
+        Handle a click on a row's edit button.
         
-        # Assembly
-        item_layout.addLayout(top_row)
-        item_layout.addWidget(progress_bar)
+        Args:
+            row: (Exercise, ExerciseLog) carried by the clicked row
+        """
+        exercise, log = row
+        self._on_edit_progress(exercise.id, log)
+    
+    def _on_delete_requested(self, row) -> None:
+        """
+        Handle a click on a row's delete button.
         
-        # Add to list with fixed height
-        list_item = QListWidgetItem()
-        list_item.setSizeHint(QSize(0, 80))
-        self.list_widget.addItem(list_item)
-        self.list_widget.setItemWidget(list_item, item_widget)
+        Args:
+            row: (Exercise, ExerciseLog) carried by the clicked row
+        """
+        exercise, _ = row
+        self._on_delete_exercise(exercise.id, exercise.name)
     
     def _on_checkbox_changed(self, exercise_id: int, state: int) -> None:
         """
@@ -296,7 +273,10 @@ class ExerciseChecklistWidget(QWidget):
             current_value: Pre-filled value
         """
         try:
-            exercise = self._exercise_manager.get_exercise_by_id(exercise_id)
+            exercise = (
+                self._exercise_cache.get(exercise_id)
+                or self._exercise_manager.get_exercise_by_id(exercise_id)
+            )
             if not exercise:
                 return
             
@@ -461,6 +441,282 @@ class ExerciseChecklistWidget(QWidget):
         self._load_exercises()
 
 
+class ExerciseItemDelegate(QStyledItemDelegate):
+    """
+    Item delegate painting exercise rows.
+    
+    Each row shows a checkbox with the exercise name, edit and delete
+    buttons, and a progress bar. Rows carry an (Exercise, ExerciseLog)
+    tuple in Qt.ItemDataRole.UserRole; rows without one (the empty-state
+    message) are painted normally.
+    
+    Signals:
+        toggle_requested: Emitted with the row's tuple when the checkbox
+            or name is clicked
+        edit_requested: Emitted with the row's tuple for the edit button
+        delete_requested: Emitted with the row's tuple for the delete button
+    """
+    
+    toggle_requested = pyqtSignal(object)
+    edit_requested = pyqtSignal(object)
+    delete_requested = pyqtSignal(object)
+    
+    ROW_HEIGHT = 80
+    ROW_GAP = 8  # Blank space between rows, inside each row's size hint
+    MARGIN = 5
+    BUTTON_WIDTH = 40
+    BUTTON_HEIGHT = 30
+    CHECKBOX_SIZE = 18
+    BAR_HEIGHT = 20
+    EDIT_TOOLTIP = "Edit progress"
+    DELETE_TOOLTIP = "Delete exercise"
+    
+    def __init__(self, parent=None):
+        """
+        Initialize delegate and the fonts/colors shared by all rows.
+        
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self._name_font = QFont()
+        self._name_font.setPixelSize(16)
+        self._name_font.setBold(True)
+        
+        self._edit_font = QFont()
+        self._edit_font.setPixelSize(20)
+        self._edit_font.setBold(True)
+        
+        self._delete_font = QFont()
+        self._delete_font.setPixelSize(18)
+        
+        self._bar_font = QFont()
+        self._bar_font.setPixelSize(14)
+        self._bar_font.setBold(True)
+        
+        self._text_color = QColor('#FFFFFF')
+        self._checkbox_pen = QPen(self._text_color, 2)
+        self._checked_color = QColor('#32CD32')
+        self._edit_color = QColor('#4ECDC4')
+        self._edit_hover_color = QColor('#6FE4DB')
+        self._edit_text_color = QColor('#000000')
+        self._delete_color = QColor('#F44336')
+        self._delete_hover_color = QColor('#D32F2F')
+        self._bar_border_pen = QPen(QColor('#555555'), 1)
+        self._bar_background = QColor('#3D3D3D')
+        self._bar_fill = QColor('#178117')
+        
+        # Button under the mouse, tracked from MouseMove in editorEvent
+        self._hover_index = QPersistentModelIndex()
+        self._hover_button: Optional[str] = None
+    
+    def _layout(self, row_rect: QRect) -> Tuple[QRect, QRect, QRect, QRect]:
+        """
+        Compute the clickable and progress regions for a row.
+        
+        Args:
+            row_rect: Row rectangle in viewport coordinates
+            
+        Returns:
+            (toggle, edit, delete, progress bar) rectangles
+        """
+        content = row_rect.adjusted(
+            self.MARGIN, self.MARGIN + self.ROW_GAP // 2,
+            -self.MARGIN, -self.MARGIN - self.ROW_GAP // 2
+        )
+        top = content.top()
+        
+        delete_rect = QRect(
+            content.right() - self.BUTTON_WIDTH + 1, top,
+            self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+        edit_rect = QRect(
+            delete_rect.left() - self.MARGIN - self.BUTTON_WIDTH, top,
+            self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+        toggle_rect = QRect(
+            content.left(), top,
+            edit_rect.left() - self.MARGIN - content.left(), self.BUTTON_HEIGHT
+        )
+        bar_rect = QRect(
+            content.left(), content.bottom() - self.BAR_HEIGHT + 1,
+            content.width(), self.BAR_HEIGHT
+        )
+        return toggle_rect, edit_rect, delete_rect, bar_rect
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return fixed row height for exercise rows."""
+        if index.data(Qt.ItemDataRole.UserRole) is None:
+            return super().sizeHint(option, index)
+        return QSize(0, self.ROW_HEIGHT + self.ROW_GAP)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint checkbox, name, buttons and progress bar for a row."""
+        row = index.data(Qt.ItemDataRole.UserRole)
+        if row is None:
+            super().paint(painter, option, index)
+            return
+        exercise, log = row
+        
+        # Row background (hover/selection) from the current style, leaving
+        # the gap between rows unpainted
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        panel_option = QStyleOptionViewItem(option)
+        panel_option.rect = option.rect.adjusted(0, self.ROW_GAP // 2, 0, -(self.ROW_GAP // 2))
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, panel_option, painter, widget)
+        
+        toggle_rect, edit_rect, delete_rect, bar_rect = self._layout(option.rect)
+        
+        hovered_button = None
+        if option.state & QStyle.StateFlag.State_MouseOver and self._hover_index == index:
+            hovered_button = self._hover_button
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Checkbox indicator, filled when completed
+        box_rect = QRect(
+            toggle_rect.left() + 1,
+            toggle_rect.center().y() - self.CHECKBOX_SIZE // 2,
+            self.CHECKBOX_SIZE, self.CHECKBOX_SIZE
+        )
+        painter.setPen(self._checkbox_pen)
+        if log.completed:
+            painter.setBrush(self._checked_color)
+        else:
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(box_rect, 3, 3)
+        
+        # Exercise name
+        name_rect = QRect(toggle_rect)
+        name_rect.setLeft(box_rect.right() + 1 + 2 * self.MARGIN)
+        painter.setFont(self._name_font)
+        painter.setPen(self._text_color)
+        painter.drawText(
+            name_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(self._name_font).elidedText(
+                exercise.name, Qt.TextElideMode.ElideRight, name_rect.width()
+            )
+        )
+        
+        # Edit and delete buttons
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._edit_hover_color if hovered_button == 'edit' else self._edit_color)
+        painter.drawRoundedRect(edit_rect, 4, 4)
+        painter.setBrush(self._delete_hover_color if hovered_button == 'delete' else self._delete_color)
+        painter.drawRoundedRect(delete_rect, 4, 4)
+        
+        painter.setFont(self._edit_font)
+        painter.setPen(self._edit_text_color)
+        painter.drawText(edit_rect, Qt.AlignmentFlag.AlignCenter, "⋯")
+        painter.setFont(self._delete_font)
+        painter.setPen(self._text_color)
+        painter.drawText(delete_rect, Qt.AlignmentFlag.AlignCenter, "X")
+        
+        # Progress bar with the actual/target text centered on it
+        painter.setPen(self._bar_border_pen)
+        painter.setBrush(self._bar_background)
+        painter.drawRoundedRect(bar_rect, 3, 3)
+        fill_width = int((bar_rect.width() - 4) * log.display_percentage / 100)
+        if fill_width > 0:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._bar_fill)
+            painter.drawRoundedRect(
+                QRect(bar_rect.left() + 2, bar_rect.top() + 2, fill_width, bar_rect.height() - 4),
+                2, 2
+            )
+        painter.setFont(self._bar_font)
+        painter.setPen(self._text_color)
+        painter.drawText(bar_rect, Qt.AlignmentFlag.AlignCenter, log.format_progress_text())
+        
+        painter.restore()
+    
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: QAbstractItemModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> bool:
+        """Track the hovered button and emit request signals for left clicks."""
+        if event.type() == QEvent.Type.MouseMove:
+            self._update_hover(event.position().toPoint(), option, index)
+        elif (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            row = index.data(Qt.ItemDataRole.UserRole)
+            if row is not None:
+                pos = event.position().toPoint()
+                toggle_rect, edit_rect, delete_rect, _ = self._layout(option.rect)
+                if toggle_rect.contains(pos):
+                    self.toggle_requested.emit(row)
+                    return True
+                if edit_rect.contains(pos):
+                    self.edit_requested.emit(row)
+                    return True
+                if delete_rect.contains(pos):
+                    self.delete_requested.emit(row)
+                    return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(
+        self,
+        event: QHelpEvent,
+        view: QAbstractItemView,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> bool:
+        """Show the edit/delete button tooltips for the button under the cursor."""
+        if event.type() == QEvent.Type.ToolTip and index.data(Qt.ItemDataRole.UserRole) is not None:
+            _, edit_rect, delete_rect, _ = self._layout(option.rect)
+            for rect, text in (
+                (edit_rect, self.EDIT_TOOLTIP),
+                (delete_rect, self.DELETE_TOOLTIP),
+            ):
+                if rect.contains(event.pos()):
+                    # Passing the rect hides the tooltip once the cursor leaves the button
+                    QToolTip.showText(event.globalPos(), text, view.viewport(), rect)
+                    return True
+        return super().helpEvent(event, view, option, index)
+    
+    def _update_hover(
+        self,
+        pos: QPoint,
+        option: QStyleOptionViewItem,
+        index: QModelIndex
+    ) -> None:
+        """
+        Record which button is under the mouse and repaint the row on change.
+        
+        The view already repaints rows as the mouse enters or leaves them;
+        this covers moves between regions inside one row.
+        
+        Args:
+            pos: Mouse position in viewport coordinates
+            option: Style option holding the row rectangle
+            index: Row under the mouse
+        """
+        button = None
+        if index.data(Qt.ItemDataRole.UserRole) is not None:
+            _, edit_rect, delete_rect, _ = self._layout(option.rect)
+            if edit_rect.contains(pos):
+                button = 'edit'
+            elif delete_rect.contains(pos):
+                button = 'delete'
+        
+        if self._hover_index == index and self._hover_button == button:
+            return
+        
+        self._hover_index = QPersistentModelIndex(index)
+        self._hover_button = button
+        if option.widget is not None:
+            option.widget.viewport().update(option.rect)
+
+
 class ProgressInputDialog(QDialog):
     """
     Dialog for entering exercise progress values.
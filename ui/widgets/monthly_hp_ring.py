@@ -7,6 +7,7 @@ Supports mouse interaction for day selection.
 
 from typing import Dict, Optional
 import math
+import traceback
 
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
@@ -310,5 +311,4 @@ class MonthlyHPRingWidget(QWidget):
         
         except Exception as e:
             print(f"Error in mousePressEvent: {e}")
-            import traceback
             traceback.print_exc()
\ No newline at end of file
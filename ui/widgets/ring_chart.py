@@ -5,7 +5,7 @@ Displays dual-ring circular progress chart with category-colored segments
 showing Stamina (outer ring) and Mana (inner ring) independently.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QRectF, QPointF
 from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath, QFont
@@ -45,7 +45,7 @@ class RingChartWidget(QWidget):
         self._load_data()
         self._connect_signals()
     
-    def update_from_points(self, points: dict) -> None:
+    def update_from_points(self, points: dict, hp: Optional[int] = None) -> None:
         """
         Update ring chart from manual points input with dual-ring display.
         
@@ -55,6 +55,7 @@ class RingChartWidget(QWidget):
         
         Args:
             points: Dictionary with 'physical', 'mental' keys (each 0-10)
+            hp: Stored HP for these points; derived from points if None
         
         Examples:
             >>> update_from_points({'physical': 6, 'mental': 4})
@@ -69,10 +70,11 @@ class RingChartWidget(QWidget):
         """
         self._manual_points = points
         
-        # Calculate HP: physical + mental (0-20 range)
-        raw_hp = points['physical'] + points['mental']
-        hp = 20 + (raw_hp * 4)  # Normalize to 20-100 scale
-        hp = max(20, min(100, hp))  # Clamp to valid range
+        if hp is None:
+            # Calculate HP: physical + mental (0-20 range)
+            raw_hp = points['physical'] + points['mental']
+            hp = 20 + (raw_hp * 4)  # Normalize to 20-100 scale
+            hp = max(20, min(100, hp))  # Clamp to valid range
         
         # Constants
         MAX_POINTS_PER_CATEGORY = 10  # Maximum value for each category